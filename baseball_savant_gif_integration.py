@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import json
 import subprocess
+import threading
+import shutil
 import tempfile
 from pathlib import Path
 import csv
@@ -25,7 +27,50 @@ class BaseballSavantGIFIntegration:
         self.savant_base = "https://baseballsavant.mlb.com"
         self.temp_dir = Path(tempfile.gettempdir()) / "baseball_gifs"
         self.temp_dir.mkdir(exist_ok=True)
+        self.session = requests.Session()  # Reuse connections to baseballsavant.mlb.com
         
+        # Per-game Statcast rows, shared by the GIF step and the post step that follows it:
+        # (game_id, game_date) -> (monotonic fetch time, rows with events)
+        self._game_rows: Dict[tuple, tuple] = {}
+        self._game_rows_lock = threading.Lock()
+        self.game_rows_ttl = 120  # Short, so a just-hit HR shows up on the next attempt
+        self.max_game_rows = 16
+        
+        # Minimum spacing between Savant CSV downloads
+        self.csv_min_interval = 2.0
+        self._last_csv_fetch = 0.0
+        self._csv_fetch_lock = threading.Lock()
+        
+    def _get_game_event_rows(self, game_id: int, game_date: str, params: Dict) -> list:
+        """Fetch a game's Statcast rows with events, reusing a recent download of the same game"""
+        key = (game_id, game_date)
+        with self._game_rows_lock:
+            cached = self._game_rows.get(key)
+        if cached and time.monotonic() - cached[0] < self.game_rows_ttl:
+            return cached[1]
+        
+        # Space out downloads so a burst of HRs doesn't hammer Savant
+        with self._csv_fetch_lock:
+            wait = self._last_csv_fetch + self.csv_min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_csv_fetch = time.monotonic()
+        
+        # Use the CSV export endpoint for easier parsing
+        url = f"{self.savant_base}/statcast_search/csv"
+        response = self.session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        # Get all plays with events (not just pitches)
+        rows = [row for row in csv.DictReader(StringIO(response.text)) if row.get('events')]
+        
+        if rows:
+            with self._game_rows_lock:
+                if key not in self._game_rows and len(self._game_rows) >= self.max_game_rows:
+                    self._game_rows.pop(next(iter(self._game_rows)))
+                self._game_rows[key] = (time.monotonic(), rows)
+        return rows
+    
     def get_statcast_data_for_play(self, game_id: int, play_id: int, game_date: str, mlb_play_data: Dict = None) -> Optional[Dict]:
         """Get Statcast data for a specific play"""
         try:
@@ -72,19 +117,7 @@ class BaseballSavantGIFIntegration:
                 'type': 'details',
             }
             
-            # Use the CSV export endpoint for easier parsing
-            url = f"{self.savant_base}/statcast_search/csv"
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # Parse CSV data
-            csv_reader = csv.DictReader(StringIO(response.text))
-            
-            # Get all plays with events (not just pitches)
-            plays_with_events = []
-            for row in csv_reader:
-                if row.get('events'):  # Only rows with actual events
-                    plays_with_events.append(row)
+            plays_with_events = self._get_game_event_rows(game_id, game_date, params)
             
             logger.info(f"Found {len(plays_with_events)} plays with events for game {game_id}")
             
@@ -144,7 +177,7 @@ class BaseballSavantGIFIntegration:
             
             # Get game data from Baseball Savant /gf endpoint
             gf_url = f"{self.savant_base}/gf?game_pk={game_id}&at_bat_number=1"
-            gf_response = requests.get(gf_url, timeout=15)
+            gf_response = self.session.get(gf_url, timeout=15)
             
             if gf_response.status_code != 200:
                 logger.warning(f"Failed to get game data from /gf endpoint: {gf_response.status_code}")
@@ -248,7 +281,7 @@ class BaseballSavantGIFIntegration:
             logger.info(f"Getting video URL for play UUID: {target_play_uuid}")
             
             sporty_url = f"{self.savant_base}/sporty-videos?playId={target_play_uuid}"
-            response = requests.get(sporty_url, timeout=15)
+            response = self.session.get(sporty_url, timeout=15)
             
             if response.status_code == 200:
                 html_content = response.text
@@ -269,7 +302,7 @@ class BaseballSavantGIFIntegration:
                         
                         # Test if this URL actually works
                         try:
-                            test_response = requests.head(video_url, timeout=10)
+                            test_response = self.session.head(video_url, timeout=10)
                             if test_response.status_code == 200:
                                 content_type = test_response.headers.get('content-type', '')
                                 if 'video' in content_type:
@@ -302,7 +335,7 @@ class BaseballSavantGIFIntegration:
             }
             
             url = f"{self.savant_base}/illustrator/api/download"
-            response = requests.get(url, params=illustrator_params, timeout=20)
+            response = self.session.get(url, params=illustrator_params, timeout=20)
             
             if response.status_code == 200:
                 # Check if response contains a video URL
@@ -317,11 +350,14 @@ class BaseballSavantGIFIntegration:
     
     def download_and_convert_to_gif(self, video_url: str, output_path: str, max_duration: int = 10) -> bool:
         """Download video and convert to GIF using ffmpeg"""
+        # Per-call scratch dir so concurrent conversions never share a video or palette
+        work_dir = Path(tempfile.mkdtemp(prefix="gif_", dir=self.temp_dir))
         try:
             # Download the video
-            temp_video = self.temp_dir / f"temp_video_{int(time.time())}.mp4"
+            temp_video = work_dir / "video.mp4"
+            palette = work_dir / "palette.png"
             
-            response = requests.get(video_url, stream=True, timeout=30)
+            response = self.session.get(video_url, stream=True, timeout=30)
             response.raise_for_status()
             
             with open(temp_video, 'wb') as f:
@@ -336,7 +372,7 @@ class BaseballSavantGIFIntegration:
                 '-t', str(max_duration),  # Limit duration
                 '-vf', 'fps=15,scale=480:-1:flags=lanczos,palettegen=stats_mode=diff',
                 '-y',
-                str(self.temp_dir / 'palette.png')
+                str(palette)
             ]
             
             # Generate palette
@@ -346,7 +382,7 @@ class BaseballSavantGIFIntegration:
             gif_cmd = [
                 'ffmpeg',
                 '-i', str(temp_video),
-                '-i', str(self.temp_dir / 'palette.png'),
+                '-i', str(palette),
                 '-t', str(max_duration),
                 '-lavfi', 'fps=15,scale=480:-1:flags=lanczos[x];[x][1:v]paletteuse=dither=bayer:bayer_scale=5',
                 '-y',
@@ -355,10 +391,6 @@ class BaseballSavantGIFIntegration:
             
             subprocess.run(gif_cmd, check=True, capture_output=True)
             
-            # Clean up
-            temp_video.unlink()
-            (self.temp_dir / 'palette.png').unlink(missing_ok=True)
-            
             # Check file size (Twitter limit is ~15MB for GIFs)
             if Path(output_path).stat().st_size > 15 * 1024 * 1024:
                 logger.warning(f"GIF too large: {Path(output_path).stat().st_size / 1024 / 1024:.1f}MB")
@@ -373,6 +405,9 @@ class BaseballSavantGIFIntegration:
         except Exception as e:
             logger.error(f"Error creating GIF: {e}")
             return False
+        finally:
+            # Clean up the downloaded video and palette
+            shutil.rmtree(work_dir, ignore_errors=True)
     
     def get_gif_for_play(self, game_id: int, play_id: int, game_date: str, mlb_play_data: Dict = None) -> Optional[str]:
         """Create a GIF for a specific play and return the file path"""
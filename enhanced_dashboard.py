@@ -4,425 +4,203 @@ Flask Dashboard for Enhanced MLB Impact Tracker
 Displays real-time queue status, GIF processing, and system metrics
 """
 
-from flask import Flask, render_template_string, jsonify, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, flash
+from flask_compress import Compress
+from markupsafe import Markup
 import threading
 import os
+import time
+import hashlib
+import orjson
 from datetime import datetime
 from enhanced_impact_tracker import EnhancedImpactTracker
 from discord_integration import discord_client
 import logging
 
-app = Flask(__name__)
+# Stylesheet lives in static/ and is browser-cached for an hour
+app = Flask(__name__, static_folder='static')
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+# Dashboard template is compiled once and kept; no per-request mtime checks
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+
+# Compress HTML/JSON responses (Brotli preferred, gzip fallback); tiny
+# responses like /health are left alone
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
 tracker = None
+monitoring_thread = None
 logger = logging.getLogger(__name__)
 
+# Serializes startup, /start and /stop so overlapping calls can't launch two monitor loops
+_lifecycle_lock = threading.Lock()
+
+def _monitoring_alive():
+    """True while a monitor loop thread is running"""
+    return monitoring_thread is not None and monitoring_thread.is_alive()
+
+# Tracker status shared by the dashboard and /api/status for a few seconds
+STATUS_CACHE_TTL = 5.0
+_status_cache = {'ts': 0.0, 'status': None}
+_status_lock = threading.Lock()
+
+def _cached_status():
+    """Tracker status, fetched at most once per STATUS_CACHE_TTL seconds"""
+    with _status_lock:
+        now = time.monotonic()
+        if _status_cache['status'] is None or now - _status_cache['ts'] >= STATUS_CACHE_TTL:
+            _status_cache.update(ts=now, status=tracker.get_status() if tracker else {})
+        return _status_cache['status']
+
+# Rendered dashboard and its ETag, rebuilt only when the cached status changes
+_dashboard_cache = {'status': None, 'etag': None, 'body': None}
+_dashboard_lock = threading.Lock()
+
+# Queue list fragment, re-rendered only when the queue contents change: (queue key, html)
+_queue_fragment_cache = (None, Markup(''))
+
+def _render_queue(queue_details):
+    """Rendered queue list for the dashboard, reused while the queue is unchanged"""
+    global _queue_fragment_cache
+    key = orjson.dumps(queue_details, default=str)
+    cached_key, fragment = _queue_fragment_cache
+    if cached_key != key:
+        fragment = Markup(render_template('enhanced_queue.html', queue_details=queue_details))
+        _queue_fragment_cache = (key, fragment)
+    return fragment
+
+def _render_dashboard():
+    """Return (etag, html) for the current cached status"""
+    status = _cached_status()
+    with _dashboard_lock:
+        if _dashboard_cache['status'] is not status:
+            queue_html = _render_queue(status.get('queue_details') or [])
+            body = render_template('enhanced_dashboard.html', status=status, queue_html=queue_html)
+            _dashboard_cache.update(status=status, etag=hashlib.md5(body.encode()).hexdigest(), body=body)
+        return _dashboard_cache['etag'], _dashboard_cache['body']
+
+# /api/status body, re-encoded only when the cached status changes: (status, bytes)
+_status_json_cache = (None, b'')
+
+def _status_json():
+    """orjson-encoded bytes for the current cached status"""
+    global _status_json_cache
+    status = _cached_status()
+    cached_status, body = _status_json_cache
+    if cached_status is not status:
+        body = orjson.dumps(status, default=str)
+        _status_json_cache = (status, body)
+    return body
+
+# Change marker for /events: status minus the ever-ticking uptime, as (status, hex digest)
+_status_signature_cache = (None, '')
+
+def _status_signature():
+    """Short digest that changes only when the dashboard's data changes"""
+    global _status_signature_cache
+    status = _cached_status()
+    cached_status, signature = _status_signature_cache
+    if cached_status is not status:
+        stable = {key: value for key, value in status.items() if key != 'uptime'}
+        signature = hashlib.md5(orjson.dumps(stable, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        _status_signature_cache = (status, signature)
+    return signature
+
 @app.route('/')
 def dashboard():
     """Enhanced dashboard showing queue status and GIF processing"""
-    status = tracker.get_status() if tracker else {}
+    etag, body = _render_dashboard()
     
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Enhanced MLB Impact Tracker</title>
-        <meta http-equiv="refresh" content="15">
-        <style>
-            body { 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif; 
-                margin: 0; 
-                padding: 20px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white; 
-                min-height: 100vh;
-            }
-            .container { max-width: 1200px; margin: 0 auto; }
-            .header { 
-                text-align: center; 
-                margin-bottom: 40px; 
-                padding: 30px;
-                background: rgba(0,0,0,0.2);
-                border-radius: 15px;
-                backdrop-filter: blur(10px);
-            }
-            .header h1 { 
-                font-size: 2.5em; 
-                margin: 0;
-                background: linear-gradient(45deg, #ff6b35, #f7931e);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }
-            .header p { 
-                font-size: 1.2em; 
-                opacity: 0.9; 
-                margin: 10px 0 0 0;
-            }
-            
-            .stats-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 25px;
-                margin-bottom: 40px;
-            }
-            
-            .stat-card {
-                background: rgba(255,255,255,0.1);
-                backdrop-filter: blur(10px);
-                border-radius: 15px;
-                padding: 25px;
-                border: 1px solid rgba(255,255,255,0.2);
-                transition: transform 0.3s ease;
-            }
-            
-            .stat-card:hover {
-                transform: translateY(-5px);
-            }
-            
-            .stat-title {
-                font-size: 1.1em;
-                margin-bottom: 15px;
-                color: #ff6b35;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            
-            .stat-value {
-                font-size: 2.5em;
-                font-weight: bold;
-                margin-bottom: 10px;
-                color: #00ff88;
-            }
-            
-            .stat-label {
-                opacity: 0.8;
-                font-size: 0.9em;
-            }
-            
-            .status-indicator {
-                display: inline-block;
-                padding: 8px 16px;
-                border-radius: 25px;
-                font-weight: 600;
-                font-size: 0.9em;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            .status-active {
-                background: linear-gradient(45deg, #28a745, #20c997);
-                color: white;
-            }
-            
-            .status-inactive {
-                background: linear-gradient(45deg, #dc3545, #c82333);
-                color: white;
-            }
-            
-            .queue-section {
-                background: rgba(0,0,0,0.3);
-                border-radius: 15px;
-                padding: 30px;
-                backdrop-filter: blur(10px);
-                border: 1px solid rgba(255,255,255,0.1);
-            }
-            
-            .queue-header {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                margin-bottom: 25px;
-                padding-bottom: 15px;
-                border-bottom: 2px solid rgba(255,107,53,0.3);
-            }
-            
-            .queue-title {
-                font-size: 1.5em;
-                font-weight: bold;
-                color: #ff6b35;
-            }
-            
-            .queue-count {
-                background: linear-gradient(45deg, #ff6b35, #f7931e);
-                color: white;
-                padding: 8px 16px;
-                border-radius: 20px;
-                font-weight: bold;
-            }
-            
-            .queue-item {
-                background: rgba(255,255,255,0.05);
-                border-radius: 12px;
-                padding: 20px;
-                margin-bottom: 15px;
-                border-left: 4px solid #ff6b35;
-                transition: all 0.3s ease;
-            }
-            
-            .queue-item:hover {
-                background: rgba(255,255,255,0.1);
-                transform: translateX(5px);
-            }
-            
-            .play-header {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                margin-bottom: 15px;
-            }
-            
-            .play-event {
-                font-size: 1.2em;
-                font-weight: bold;
-                color: #00ff88;
-            }
-            
-            .play-impact {
-                background: linear-gradient(45deg, #6f42c1, #e83e8c);
-                color: white;
-                padding: 6px 12px;
-                border-radius: 15px;
-                font-weight: bold;
-                font-size: 0.9em;
-            }
-            
-            .play-details {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 15px;
-                margin-bottom: 15px;
-            }
-            
-            .detail-item {
-                text-align: center;
-            }
-            
-            .detail-label {
-                font-size: 0.8em;
-                opacity: 0.7;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                margin-bottom: 5px;
-            }
-            
-            .detail-value {
-                font-weight: bold;
-                font-size: 1.1em;
-            }
-            
-            .progress-bar {
-                background: rgba(0,0,0,0.3);
-                border-radius: 10px;
-                height: 8px;
-                margin-top: 15px;
-                overflow: hidden;
-            }
-            
-            .progress-fill {
-                height: 100%;
-                border-radius: 10px;
-                transition: width 0.3s ease;
-            }
-            
-            .progress-gif-pending { background: linear-gradient(45deg, #ffc107, #fd7e14); }
-            .progress-gif-processing { background: linear-gradient(45deg, #17a2b8, #6f42c1); }
-            .progress-gif-ready { background: linear-gradient(45deg, #28a745, #20c997); }
-            
-            .no-queue {
-                text-align: center;
-                padding: 40px;
-                opacity: 0.7;
-                font-size: 1.1em;
-            }
-            
-            .footer {
-                text-align: center;
-                margin-top: 40px;
-                padding: 20px;
-                opacity: 0.6;
-                font-size: 0.9em;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🎬 Enhanced MLB Impact Tracker</h1>
-                <p>Real-time monitoring with GIF integration</p>
-            </div>
-            
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-title">🔍 Monitoring Status</div>
-                    <div class="stat-value">
-                        <span class="status-indicator {{ 'status-active' if status.get('monitoring') else 'status-inactive' }}">
-                            {{ '🟢 ACTIVE' if status.get('monitoring') else '🔴 INACTIVE' }}
-                        </span>
-                    </div>
-                    <div class="stat-label">System Status</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">🎬 GIF Processing</div>
-                    <div class="stat-value">
-                        <span class="status-indicator {{ 'status-active' if status.get('processing_gifs') else 'status-inactive' }}">
-                            {{ '🟢 RUNNING' if status.get('processing_gifs') else '🔴 STOPPED' }}
-                        </span>
-                    </div>
-                    <div class="stat-label">Background Thread</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">📊 Plays Queued Today</div>
-                    <div class="stat-value">{{ status.get('plays_queued_today', 0) }}</div>
-                    <div class="stat-label">High-Impact Plays Detected</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">🎬 GIFs Created Today</div>
-                    <div class="stat-value">{{ status.get('gifs_created_today', 0) }}</div>
-                    <div class="stat-label">Successful Video Processing</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">🎬 Tweets Posted Today</div>
-                    <div class="stat-value">{{ status.get('tweets_posted_today', 0) }}</div>
-                    <div class="stat-label">Complete Posts with GIFs</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">⏰ System Uptime</div>
-                    <div class="stat-value" style="font-size: 1.5em;">{{ status.get('uptime', 'Not started') }}</div>
-                    <div class="stat-label">Running Since Start</div>
-                </div>
-                
-                <div class="stat-card">
-                    <div class="stat-title">💬 Discord Test</div>
-                    <div class="stat-value" style="font-size: 1.2em;">
-                        <a href="/test-discord" style="text-decoration: none;">
-                            <button style="
-                                background: linear-gradient(45deg, #5865F2, #7289DA);
-                                color: white;
-                                border: none;
-                                padding: 12px 24px;
-                                border-radius: 25px;
-                                font-weight: bold;
-                                cursor: pointer;
-                                transition: transform 0.2s ease;
-                                font-size: 0.9em;
-                                text-transform: uppercase;
-                                letter-spacing: 1px;
-                            " onmouseover="this.style.transform='scale(1.05)'" onmouseout="this.style.transform='scale(1)'">
-                                🚀 Send Test Message
-                            </button>
-                        </a>
-                    </div>
-                    <div class="stat-label">Test Discord Webhook</div>
-                </div>
-            </div>
-            
-            <div class="queue-section">
-                <div class="queue-header">
-                    <div class="queue-title">🎯 Processing Queue</div>
-                    <div class="queue-count">{{ status.get('current_queue_size', 0) }} plays</div>
-                </div>
-                
-                {% if status.get('queue_details') %}
-                    {% for play in status.queue_details %}
-                        <div class="queue-item">
-                            <div class="play-header">
-                                <div class="play-event">{{ play.event }}</div>
-                                <div class="play-impact">{{ play.impact }} Impact</div>
-                            </div>
-                            
-                            <div class="play-details">
-                                <div class="detail-item">
-                                    <div class="detail-label">Teams</div>
-                                    <div class="detail-value">{{ play.teams }}</div>
-                                </div>
-                                <div class="detail-item">
-                                    <div class="detail-label">Queued At</div>
-                                    <div class="detail-value">{{ play.timestamp }}</div>
-                                </div>
-                                <div class="detail-item">
-                                    <div class="detail-label">GIF Attempts</div>
-                                    <div class="detail-value">{{ play.attempts }}/5</div>
-                                </div>
-                                <div class="detail-item">
-                                    <div class="detail-label">Status</div>
-                                    <div class="detail-value">
-                                        {% if play.tweet_posted %}
-                                            ✅ Posted
-                                        {% elif play.gif_created %}
-                                            🎬 GIF Ready
-                                        {% else %}
-                                            ⏳ Processing
-                                        {% endif %}
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <div class="progress-bar">
-                                {% if play.tweet_posted %}
-                                    <div class="progress-fill progress-gif-ready" style="width: 100%;"></div>
-                                {% elif play.gif_created %}
-                                    <div class="progress-fill progress-gif-ready" style="width: 75%;"></div>
-                                {% elif play.attempts > 0 %}
-                                    <div class="progress-fill progress-gif-processing" style="width: {{ (play.attempts / 5) * 50 }}%;"></div>
-                                {% else %}
-                                    <div class="progress-fill progress-gif-pending" style="width: 10%;"></div>
-                                {% endif %}
-                            </div>
-                        </div>
-                    {% endfor %}
-                {% else %}
-                    <div class="no-queue">
-                        <div>🎯 No plays currently in queue</div>
-                        <div style="margin-top: 10px; opacity: 0.6;">Monitoring for high-impact plays...</div>
-                    </div>
-                {% endif %}
-            </div>
-            
-            <div class="footer">
-                <div>Last Updated: {{ status.get('last_check_time', 'Never') }}</div>
-                <div>Twitter Connected: {{ '✅' if status.get('twitter_connected') else '❌' }}</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    # Answers 304 Not Modified when the browser already has this render
+    response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'max-age={int(STATUS_CACHE_TTL)}'
+    return response.make_conditional(request)
+
+# /events re-sends the current signature at least this often, so uptime stays
+# roughly current and idle proxies don't drop the stream
+EVENTS_HEARTBEAT = 60.0
+# Each stream ends after this long and the browser reconnects after EVENTS_RETRY_MS,
+# so abandoned tabs don't hold a worker greenlet forever
+EVENTS_LIFETIME = 300.0
+EVENTS_RETRY_MS = 5000
+# Past this many open streams, clients fall back to the 15s page reload
+EVENTS_MAX_STREAMS = 8
+
+_open_streams = 0
+_open_streams_lock = threading.Lock()
+
+def _release_stream():
+    """Free an /events slot once its response is closed"""
+    global _open_streams
+    with _open_streams_lock:
+        _open_streams -= 1
+
+@app.route('/events')
+def dashboard_events():
+    """Server-sent events: one message whenever the dashboard status changes"""
+    global _open_streams
+    with _open_streams_lock:
+        if _open_streams >= EVENTS_MAX_STREAMS:
+            # 204 tells EventSource not to reconnect; the page then polls instead
+            return Response(status=204)
+        _open_streams += 1
+    
+    def stream():
+        yield f"retry: {EVENTS_RETRY_MS}\n\n"
+        last_signature = None
+        last_sent = 0.0
+        deadline = time.monotonic() + EVENTS_LIFETIME
+        while time.monotonic() < deadline:
+            signature = _status_signature()
+            now = time.monotonic()
+            if signature != last_signature or now - last_sent >= EVENTS_HEARTBEAT:
+                yield f"data: {signature}\n\n"
+                last_signature = signature
+                last_sent = now
+            time.sleep(STATUS_CACHE_TTL)
     
-    return render_template_string(html, status=status)
+    response = Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    response.call_on_close(_release_stream)
+    return response
 
 @app.route('/api/status')
 def api_status():
     """API endpoint for status data"""
-    return jsonify(tracker.get_status() if tracker else {})
+    return Response(_status_json(), mimetype='application/json')
 
 @app.route('/start')
 def start_monitoring():
     """Start the enhanced monitoring"""
-    global tracker
-    if not tracker:
-        tracker = EnhancedImpactTracker()
-    
-    if not tracker.monitoring:
+    global tracker, monitoring_thread
+    with _lifecycle_lock:
+        if not tracker:
+            tracker = EnhancedImpactTracker()
+        
+        if _monitoring_alive():
+            return "ℹ️ Monitoring already running"
+        
         # Start monitoring in a separate thread
         monitoring_thread = threading.Thread(target=tracker.monitor_games, daemon=True)
         monitoring_thread.start()
+        _status_cache['ts'] = 0.0
         return "✅ Enhanced monitoring started!"
-    else:
-        return "ℹ️ Monitoring already running"
 
 @app.route('/stop')
 def stop_monitoring():
     """Stop the enhanced monitoring"""
-    if tracker and tracker.monitoring:
-        tracker.stop_monitoring()
-        return "🛑 Enhanced monitoring stopped!"
-    else:
-        return "ℹ️ Monitoring not running"
+    with _lifecycle_lock:
+        if tracker and tracker.monitoring:
+            tracker.stop_monitoring()
+            _status_cache['ts'] = 0.0
+            return "🛑 Enhanced monitoring stopped!"
+        else:
+            return "ℹ️ Monitoring not running"
 
 @app.route('/health')
 def health_check():
@@ -472,27 +250,37 @@ def ping():
         'monitoring_active': tracker.monitoring if tracker else False
     })
 
-def main():
-    """Main function to run the dashboard"""
-    global tracker
-    tracker = EnhancedImpactTracker()
-    
-    # Auto-start monitoring like the original system
-    logger.info("🏃 Auto-starting monitoring...")
-    
-    def run_monitoring():
-        """Run monitoring with keep-alive URL"""
-        # Get keep-alive URL for this dashboard
-        base_url = os.environ.get('RENDER_EXTERNAL_URL', 'https://mlb-impactful-plays.onrender.com')
-        keep_alive_url = f"{base_url}/api/ping"
-        logger.info(f"💓 Using keep-alive URL: {keep_alive_url}")
+def start_background_services():
+    """Create the tracker and start monitoring (called once per gunicorn worker via gunicorn.conf.py)"""
+    global tracker, monitoring_thread
+    with _lifecycle_lock:
+        if _monitoring_alive():
+            logger.info("ℹ️ Monitoring already running")
+            return
         
-        # Start monitoring with keep-alive ping
-        tracker.monitor_games(keep_alive_url=keep_alive_url)
-    
-    monitoring_thread = threading.Thread(target=run_monitoring, daemon=True)
-    monitoring_thread.start()
-    logger.info("🚀 Started Enhanced Impact tracker thread with keep-alive ping")
+        if not tracker:
+            tracker = EnhancedImpactTracker()
+        
+        # Auto-start monitoring like the original system
+        logger.info("🏃 Auto-starting monitoring...")
+        
+        def run_monitoring():
+            """Run monitoring with keep-alive URL"""
+            # Get keep-alive URL for this dashboard
+            base_url = os.environ.get('RENDER_EXTERNAL_URL', 'https://mlb-impactful-plays.onrender.com')
+            keep_alive_url = f"{base_url}/api/ping"
+            logger.info(f"💓 Using keep-alive URL: {keep_alive_url}")
+            
+            # Start monitoring with keep-alive ping
+            tracker.monitor_games(keep_alive_url=keep_alive_url)
+        
+        monitoring_thread = threading.Thread(target=run_monitoring, daemon=True)
+        monitoring_thread.start()
+        logger.info("🚀 Started Enhanced Impact tracker thread with keep-alive ping")
+
+def main():
+    """Main function (local development server; production runs under gunicorn)"""
+    start_background_services()
     
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_ENV') == 'development'
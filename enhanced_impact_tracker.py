@@ -8,13 +8,17 @@ import os
 import sys
 import time
 import json
+import orjson
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
 from io import StringIO
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set
 import pickle
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 import threading
 import signal
@@ -96,6 +100,20 @@ class EnhancedImpactTracker:
         self.schedule_api_base = "https://statsapi.mlb.com/api/v1"  # Schedule uses v1 API
         self.gif_integration = BaseballSavantGIFIntegration()
         
+        # Shared keep-alive session for StatsAPI and Savant; sized for concurrent fetchers
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        
+        # Per-game Savant rows: game_id -> (fetched_at, [(wp_change, row)]), FIFO-evicted
+        self._savant_rows: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._savant_rows_lock = threading.Lock()
+        self.savant_rows_ttl = 60  # Live games gain plays; refetch at most once per cycle
+        self.max_savant_games = 32
+        
         # Queue management - Memory conscious settings for 512MB deployment
         self.play_queue: List[QueuedPlay] = []
         self.processed_plays: Set[str] = set()  # Track plays we've seen to avoid duplicates
@@ -106,10 +124,13 @@ class EnhancedImpactTracker:
         # Monitoring state
         self.monitoring = False
         self.processing_gifs = False
+        self.gif_thread = None
+        self._stop_event = threading.Event()  # set by stop_monitoring to cut sleeps short
         
         # Statistics
         self.start_time = None
         self.last_check_time = None
+        self.last_check_display = 'Never'  # last_check_time preformatted for get_status
         self.tweets_posted_today = 0
         self.gifs_created_today = 0
         self.plays_queued_today = 0
@@ -145,7 +166,7 @@ class EnhancedImpactTracker:
             logger.info("🏥 Testing MLB API connectivity...")
             test_url = f"{self.schedule_api_base}/schedule"
             test_params = {'sportId': 1, 'date': datetime.now().strftime('%Y-%m-%d')}
-            response = requests.get(test_url, params=test_params, timeout=10)
+            response = self.session.get(test_url, params=test_params, timeout=10)
             if response.status_code == 200:
                 logger.info("✅ MLB API: Connected successfully")
             else:
@@ -287,10 +308,10 @@ class EnhancedImpactTracker:
                         'language': 'en'
                     }
                     
-                    response = requests.get(url, params=params, timeout=30)
+                    response = self.session.get(url, params=params, timeout=30)
                     response.raise_for_status()
                     
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     
                     for date_data in data.get('dates', []):
                         for game in date_data.get('games', []):
@@ -338,157 +359,174 @@ class EnhancedImpactTracker:
             logger.error(f"Error fetching live games: {e}")
             return []
     
+    def _get_savant_wp_rows(self, game_id: int, play_data: Dict) -> List:
+        """Fetch a game's Statcast rows with a WP% change once, shared by every play lookup"""
+        cached = self._savant_rows.get(game_id)
+        if cached and time.time() - cached[0] < self.savant_rows_ttl:
+            return cached[1]
+        
+        # Get game date from the game_id using MLB API
+        try:
+            # Check if we have a test_date override (for historical testing)
+            if 'test_date' in play_data:
+                game_date_str = play_data['test_date']
+                logger.debug(f"Using test date override: {game_date_str}")
+            else:
+                game_url = f"{self.api_base}/game/{game_id}/feed/live"
+                game_response = self.session.get(game_url, timeout=15)
+                game_response.raise_for_status()
+                game_data = orjson.loads(game_response.content)
+                
+                # Extract game date from game data
+                game_date_str = game_data.get('gameData', {}).get('datetime', {}).get('originalDate', '')
+                if not game_date_str:
+                    # Fallback to the test date if we're processing historical data
+                    game_date_str = "2025-06-17"  # The test date
+                
+                logger.debug(f"Using game date from MLB API: {game_date_str}")
+            
+        except Exception as e:
+            logger.debug(f"Could not get game date from MLB API: {e}, using fallback")
+            game_date_str = "2025-06-17"  # Fallback to test date
+        
+        # Baseball Savant Statcast search parameters for the specific game
+        params = {
+            'all': 'true',
+            'hfPT': '',
+            'hfAB': '',
+            'hfBBT': '',
+            'hfPR': '',
+            'hfZ': '',
+            'stadium': '',
+            'hfBBL': '',
+            'hfNewZones': '',
+            'hfGT': 'R|',  # Regular season
+            'hfC': '',
+            'hfSea': '2025|',  # Current season
+            'hfSit': '',
+            'player_type': 'batter',
+            'hfOuts': '',
+            'opponent': '',
+            'pitcher_throws': '',
+            'batter_stands': '',
+            'hfSA': '',
+            'game_date_gt': game_date_str,
+            'game_date_lt': game_date_str,
+            'hfInfield': '',
+            'team': '',
+            'position': '',
+            'hfOutfield': '',
+            'hfRO': '',
+            'home_road': '',
+            'game_pk': game_id,  # Specific game
+            'hfFlag': '',
+            'hfPull': '',
+            'metric_1': '',
+            'hfInn': '',
+            'min_pitches': '0',
+            'min_results': '0',
+            'group_by': 'name',
+            'sort_col': 'pitches',
+            'player_event_sort': 'h_launch_speed',
+            'sort_order': 'desc',
+            'min_pas': '0',
+            'type': 'details',
+        }
+        
+        # Use the CSV export endpoint for easier parsing
+        url = "https://baseballsavant.mlb.com/statcast_search/csv"
+        logger.debug(f"Fetching Baseball Savant data for game {game_id} on {game_date_str}")
+        response = self.session.get(url, params=params, timeout=15)
+        
+        rows = []
+        if response.status_code == 200 and response.text.strip():
+            # Keep only rows carrying a usable delta_home_win_exp
+            for row in csv.DictReader(StringIO(response.text)):
+                delta_home_win_exp = row.get('delta_home_win_exp', '')
+                if delta_home_win_exp and delta_home_win_exp != 'null':
+                    try:
+                        wp_change = float(delta_home_win_exp)
+                    except (ValueError, TypeError):
+                        continue
+                    if abs(wp_change) > 0.01:  # At least 1% change
+                        rows.append((wp_change, row))
+            
+            # Only real answers are cached; errors and empty bodies are retried next lookup
+            with self._savant_rows_lock:
+                if game_id not in self._savant_rows and len(self._savant_rows) >= self.max_savant_games:
+                    self._savant_rows.popitem(last=False)
+                self._savant_rows[game_id] = (time.time(), rows)
+        else:
+            logger.debug(f"No Baseball Savant data returned (status: {response.status_code})")
+        
+        return rows
+    
     def get_enhanced_wp_data_from_savant(self, game_id: int, play_data: Dict) -> Dict:
         """
         Fetch Baseball Savant's delta_home_win_exp data for a specific play
         This is the actual WP% change that Baseball Savant calculates
         """
         try:
-            # Get game date from the game_id using MLB API
-            try:
-                # Check if we have a test_date override (for historical testing)
-                if 'test_date' in play_data:
-                    game_date_str = play_data['test_date']
-                    logger.debug(f"Using test date override: {game_date_str}")
-                else:
-                    game_url = f"{self.api_base}/game/{game_id}/feed/live"
-                    game_response = requests.get(game_url, timeout=15)
-                    game_response.raise_for_status()
-                    game_data = game_response.json()
-                    
-                    # Extract game date from game data
-                    game_date_str = game_data.get('gameData', {}).get('datetime', {}).get('originalDate', '')
-                    if not game_date_str:
-                        # Fallback to the test date if we're processing historical data
-                        game_date_str = "2025-06-17"  # The test date
-                    
-                    logger.debug(f"Using game date from MLB API: {game_date_str}")
-                
-            except Exception as e:
-                logger.debug(f"Could not get game date from MLB API: {e}, using fallback")
-                game_date_str = "2025-06-17"  # Fallback to test date
+            rows = self._get_savant_wp_rows(game_id, play_data)
             
-            # Baseball Savant Statcast search parameters for the specific game
-            params = {
-                'all': 'true',
-                'hfPT': '',
-                'hfAB': '',
-                'hfBBT': '',
-                'hfPR': '',
-                'hfZ': '',
-                'stadium': '',
-                'hfBBL': '',
-                'hfNewZones': '',
-                'hfGT': 'R|',  # Regular season
-                'hfC': '',
-                'hfSea': '2025|',  # Current season
-                'hfSit': '',
-                'player_type': 'batter',
-                'hfOuts': '',
-                'opponent': '',
-                'pitcher_throws': '',
-                'batter_stands': '',
-                'hfSA': '',
-                'game_date_gt': game_date_str,
-                'game_date_lt': game_date_str,
-                'hfInfield': '',
-                'team': '',
-                'position': '',
-                'hfOutfield': '',
-                'hfRO': '',
-                'home_road': '',
-                'game_pk': game_id,  # Specific game
-                'hfFlag': '',
-                'hfPull': '',
-                'metric_1': '',
-                'hfInn': '',
-                'min_pitches': '0',
-                'min_results': '0',
-                'group_by': 'name',
-                'sort_col': 'pitches',
-                'player_event_sort': 'h_launch_speed',
-                'sort_order': 'desc',
-                'min_pas': '0',
-                'type': 'details',
-            }
+            target_inning = play_data.get('inning')
+            target_event = play_data.get('event', '').lower()
+            target_batter = play_data.get('batter', '')
+            target_at_bat_index = play_data.get('play_id', 0)
+            
+            logger.debug(f"Looking for: Inning {target_inning}, Event: '{target_event}', Batter: '{target_batter}'")
             
-            # Use the CSV export endpoint for easier parsing
-            url = "https://baseballsavant.mlb.com/statcast_search/csv"
-            logger.debug(f"Fetching Baseball Savant data for game {game_id} on {game_date_str}")
-            response = requests.get(url, params=params, timeout=15)
+            best_matches = []
             
-            if response.status_code == 200 and response.text.strip():
-                # Parse CSV data to look for matching play with delta_home_win_exp
-                csv_reader = csv.DictReader(StringIO(response.text))
+            for wp_change, row in rows:
+                # Try to match the play by multiple criteria
+                match_score = 0
                 
-                target_inning = play_data.get('inning')
-                target_event = play_data.get('event', '').lower()
-                target_batter = play_data.get('batter', '')
-                target_at_bat_index = play_data.get('play_id', 0)
+                # Inning match
+                if str(row.get('inning', '')) == str(target_inning):
+                    match_score += 30
                 
-                logger.debug(f"Looking for: Inning {target_inning}, Event: '{target_event}', Batter: '{target_batter}'")
+                # Event type match
+                row_event = row.get('events', '').lower()
+                if target_event and row_event:
+                    if target_event in row_event or row_event in target_event:
+                        match_score += 50
+                    if target_event == row_event:
+                        match_score += 100
                 
-                best_matches = []
+                # Batter name match
+                row_batter = row.get('player_name', '')
+                if target_batter and row_batter:
+                    if target_batter.lower() in row_batter.lower() or row_batter.lower() in target_batter.lower():
+                        match_score += 40
                 
-                for row in csv_reader:
-                    # Try to match the play by multiple criteria
-                    match_score = 0
-                    
-                    # Inning match
-                    if str(row.get('inning', '')) == str(target_inning):
-                        match_score += 30
-                    
-                    # Event type match
-                    row_event = row.get('events', '').lower()
-                    if target_event and row_event:
-                        if target_event in row_event or row_event in target_event:
-                            match_score += 50
-                        if target_event == row_event:
-                            match_score += 100
-                    
-                    # Batter name match
-                    row_batter = row.get('player_name', '')
-                    if target_batter and row_batter:
-                        if target_batter.lower() in row_batter.lower() or row_batter.lower() in target_batter.lower():
-                            match_score += 40
-                    
-                    # At-bat index proximity (if available)
-                    row_at_bat = row.get('at_bat_number', '')
-                    if row_at_bat and str(row_at_bat) == str(target_at_bat_index):
-                        match_score += 30
-                    
-                    # Check for delta_home_win_exp data
-                    delta_home_win_exp = row.get('delta_home_win_exp', '')
-                    if delta_home_win_exp and delta_home_win_exp != '' and delta_home_win_exp != 'null':
-                        try:
-                            wp_change = float(delta_home_win_exp)
-                            if abs(wp_change) > 0.01:  # At least 1% change
-                                match_score += 20
-                                best_matches.append((match_score, wp_change, row))
-                        except (ValueError, TypeError):
-                            continue
+                # At-bat index proximity (if available)
+                row_at_bat = row.get('at_bat_number', '')
+                if row_at_bat and str(row_at_bat) == str(target_at_bat_index):
+                    match_score += 30
                 
-                # Sort by match score and take the best
-                if best_matches:
-                    best_matches.sort(key=lambda x: x[0], reverse=True)
-                    best_score, wp_change, best_row = best_matches[0]
-                    
-                    if best_score >= 50:  # Minimum confidence threshold
-                        logger.info(f"Found Baseball Savant WP% change: {wp_change:.1%} for {target_event} (match score: {best_score})")
-                        return {
-                            'delta_home_win_exp': wp_change,
-                            'source': 'baseball_savant_csv',
-                            'matched_event': best_row.get('events', ''),
-                            'matched_inning': best_row.get('inning'),
-                            'batter_name': best_row.get('player_name', ''),
-                            'match_score': best_score
-                        }
-                    else:
-                        logger.debug(f"Best match score {best_score} below threshold for {target_event}")
+                match_score += 20  # Row carries delta_home_win_exp data
+                best_matches.append((match_score, wp_change, row))
+            
+            # Sort by match score and take the best
+            if best_matches:
+                best_matches.sort(key=lambda x: x[0], reverse=True)
+                best_score, wp_change, best_row = best_matches[0]
+                
+                if best_score >= 50:  # Minimum confidence threshold
+                    logger.info(f"Found Baseball Savant WP% change: {wp_change:.1%} for {target_event} (match score: {best_score})")
+                    return {
+                        'delta_home_win_exp': wp_change,
+                        'source': 'baseball_savant_csv',
+                        'matched_event': best_row.get('events', ''),
+                        'matched_inning': best_row.get('inning'),
+                        'batter_name': best_row.get('player_name', ''),
+                        'match_score': best_score
+                    }
                 else:
-                    logger.debug(f"No matches with delta_home_win_exp data found")
+                    logger.debug(f"Best match score {best_score} below threshold for {target_event}")
             else:
-                logger.debug(f"No Baseball Savant data returned (status: {response.status_code})")
+                logger.debug(f"No matches with delta_home_win_exp data found")
             
             return {}
             
@@ -500,10 +538,10 @@ class EnhancedImpactTracker:
         """Get all plays from a specific game with live feed data"""
         try:
             url = f"{self.api_base}/game/{game_id}/feed/live"
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             plays = []
             
             # Get plays from live feed which includes WPA data
@@ -687,9 +725,9 @@ class EnhancedImpactTracker:
                 # Try to get game date from MLB API
                 try:
                     game_url = f"{self.api_base}/game/{play['game_id']}/feed/live"
-                    game_response = requests.get(game_url, timeout=15)
+                    game_response = self.session.get(game_url, timeout=15)
                     if game_response.status_code == 200:
-                        game_data = game_response.json()
+                        game_data = orjson.loads(game_response.content)
                         actual_game_date = game_data.get('gameData', {}).get('datetime', {}).get('originalDate', '')
                         if actual_game_date:
                             logger.debug(f"Got actual game date from MLB API: {actual_game_date}")
@@ -911,13 +949,13 @@ class EnhancedImpactTracker:
                 
                 # Sleep before next processing cycle
                 logger.debug("🎬 Sleeping 60s before next processing cycle...")
-                time.sleep(60)  # Check every minute for GIF creation
+                self._stop_event.wait(60)  # Check every minute for GIF creation
                 
             except Exception as e:
                 logger.error(f"❌ Error in GIF processing loop (cycle #{processing_cycle}): {e}")
                 logger.error(f"   Exception type: {type(e).__name__}")
                 logger.info("🔄 GIF processing will continue in 60 seconds...")
-                time.sleep(60)
+                self._stop_event.wait(60)
         
         logger.info("🎬 GIF processing thread stopped")
     
@@ -960,8 +998,9 @@ class EnhancedImpactTracker:
         self.start_time = datetime.now()
         
         # Start GIF processing thread
-        gif_thread = threading.Thread(target=self.process_gif_queue, daemon=True)
-        gif_thread.start()
+        self._stop_event.clear()
+        self.gif_thread = threading.Thread(target=self.process_gif_queue, daemon=True)
+        self.gif_thread.start()
         logger.info("🎬 GIF processing thread started")
         
         scan_count = 0
@@ -976,6 +1015,7 @@ class EnhancedImpactTracker:
                 scan_start_time = time.time()
                 self.last_check_time = datetime.now()
                 current_time_str = self.last_check_time.strftime('%Y-%m-%d %H:%M:%S ET')
+                self.last_check_display = current_time_str
                 
                 # Heartbeat logging every 10 minutes
                 if (datetime.now() - last_heartbeat).total_seconds() > heartbeat_interval:
@@ -1122,7 +1162,7 @@ class EnhancedImpactTracker:
                 # Sleep until next scan
                 if sleep_time > 0:
                     logger.debug(f"💤 Sleeping for {sleep_time:.1f}s until next scan...")
-                    time.sleep(sleep_time)
+                    self._stop_event.wait(sleep_time)
                 
             except KeyboardInterrupt:
                 logger.info("🛑 Monitoring stopped by user interrupt")
@@ -1133,14 +1173,19 @@ class EnhancedImpactTracker:
                 logger.error(f"   Stack trace: {str(e)}")
                 logger.info("🔄 System will continue monitoring in 2 minutes...")
                 logger.info("   This error has been logged and system remains operational")
-                time.sleep(120)  # Wait 2 minutes before retrying
+                self._stop_event.wait(120)  # Wait 2 minutes before retrying
     
     def stop_monitoring(self):
         """Stop the monitoring loop"""
         self.monitoring = False
         self.processing_gifs = False
+        self._stop_event.set()
         logger.info("Stopping enhanced monitoring...")
         
+        # Let the GIF thread finish its current cycle so the final save sees a settled queue
+        if self.gif_thread is not None and self.gif_thread is not threading.current_thread():
+            self.gif_thread.join(timeout=5)
+        
         # Save final queue state
         self.save_queue()
     
@@ -1149,7 +1194,7 @@ class EnhancedImpactTracker:
         status = {
             'monitoring': self.monitoring,
             'processing_gifs': self.processing_gifs,
-            'last_check_time': self.last_check_time.strftime('%Y-%m-%d %H:%M:%S ET') if self.last_check_time else 'Never',
+            'last_check_time': self.last_check_display,
             'uptime': str(datetime.now() - self.start_time).split('.')[0] if self.start_time else 'Not started',
             'plays_queued_today': self.plays_queued_today,
             'gifs_created_today': self.gifs_created_today,
@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration for the Flask dashboards
+Picked up automatically from the working directory, e.g. `gunicorn mets_dashboard:app`
+"""
+
+import sys
+
+def post_worker_init(worker):
+    """Start the served module's background services, since its main() is not run under gunicorn"""
+    module = sys.modules.get(getattr(worker.wsgi, 'import_name', ''))
+    start_background_services = getattr(module, 'start_background_services', None)
+    if start_background_services:
+        start_background_services()
@@ -10,7 +10,7 @@ import logging
 import threading
 from datetime import datetime, timedelta
 import requests
-import pytz
+from zoneinfo import ZoneInfo
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 import pickle
@@ -23,7 +23,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Eastern timezone
-eastern_tz = pytz.timezone('US/Eastern')
+eastern_tz = ZoneInfo('US/Eastern')
 
 @dataclass
 class ImpactPlay:
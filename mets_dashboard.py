@@ -6,10 +6,15 @@ Web interface for monitoring and controlling the Mets HR tracking system
 
 import os
 import json
+import time
 import threading
 import requests
+import orjson
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from flask import Flask, render_template_string, jsonify, request, redirect, url_for
+from flask_compress import Compress
 from mets_homerun_tracker import MetsHomeRunTracker
 import logging
 
@@ -19,10 +24,64 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Compress HTML/JSON responses (Brotli preferred, gzip fallback); tiny
+# responses like /health are left alone
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
 # Global tracker instance
 tracker = None
 tracker_thread = None
 
+# Read-only status shown before the tracker has been created
+_EMPTY_STATUS = MappingProxyType({
+    'monitoring': False,
+    'processing_gifs': False,
+    'uptime': None,
+    'last_check': None,
+    'queue_size': 0,
+    'processed_plays': 0,
+    'stats': MappingProxyType({
+        'homeruns_posted_today': 0,
+        'gifs_created_today': 0,
+        'homeruns_queued_today': 0
+    })
+})
+
+# Pre-serialized /api/status body for the same case
+_UNINITIALIZED_STATUS_JSON = orjson.dumps({
+    'monitoring': False,
+    'error': 'Tracker not initialized'
+})
+
+# Shared HTTP session so keep-alive pings reuse one TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+_SESSION.headers['Connection'] = 'keep-alive'
+
+# Single-flight cache for tracker.get_status(): concurrent requests share
+# one call and reuse its result for STATUS_CACHE_TTL seconds
+STATUS_CACHE_TTL = 0.5
+_status_lock = threading.Lock()
+_status_cache = {'ts': 0.0, 'val': None}
+
+def _cached_status():
+    """Return tracker status, coalescing calls made within the cache TTL"""
+    now = time.monotonic()
+    val = _status_cache['val']
+    if val is not None and now - _status_cache['ts'] < STATUS_CACHE_TTL:
+        return val
+    
+    with _status_lock:
+        # Another request may have refreshed the cache while we waited
+        now = time.monotonic()
+        if _status_cache['val'] is not None and now - _status_cache['ts'] < STATUS_CACHE_TTL:
+            return _status_cache['val']
+        val = tracker.get_status()
+        _status_cache.update(ts=now, val=val)
+        return val
+
 def start_tracker_thread():
     """Start the tracker in a separate thread"""
     global tracker, tracker_thread
@@ -41,12 +100,17 @@ def stop_tracker():
     if tracker:
         tracker.stop_monitoring()
 
+# /ping triggers an outbound keep-alive no more often than this
+KEEP_ALIVE_MIN_INTERVAL = 60.0
+_last_keep_alive = float('-inf')
+_keep_alive_lock = threading.Lock()
+
 def keep_alive_ping():
     """Send keep-alive ping to prevent deployment sleep"""
     try:
         site_url = os.getenv('SITE_URL', 'http://localhost:5000')
         if site_url != 'http://localhost:5000':  # Only ping if deployed
-            requests.get(f"{site_url}/health", timeout=10)
+            _SESSION.get(f"{site_url}/health", timeout=10)
             logger.info("💓 Keep-alive ping sent")
     except Exception as e:
         logger.warning(f"Keep-alive ping failed: {e}")
@@ -299,21 +363,9 @@ def dashboard():
     
     # Get status
     if tracker:
-        status = tracker.get_status()
+        status = _cached_status()
     else:
-        status = {
-            'monitoring': False,
-            'processing_gifs': False,
-            'uptime': None,
-            'last_check': None,
-            'queue_size': 0,
-            'processed_plays': 0,
-            'stats': {
-                'homeruns_posted_today': 0,
-                'gifs_created_today': 0,
-                'homeruns_queued_today': 0
-            }
-        }
+        status = _EMPTY_STATUS
     
     return render_template_string(DASHBOARD_TEMPLATE, status=status)
 
@@ -369,41 +421,57 @@ def api_status():
     """API endpoint for status"""
     global tracker
     if tracker:
-        return jsonify(tracker.get_status())
+        return jsonify(_cached_status())
     else:
-        return jsonify({
-            'monitoring': False,
-            'error': 'Tracker not initialized'
-        })
+        return app.response_class(_UNINITIALIZED_STATUS_JSON, mimetype='application/json')
+
+# Pre-serialized /health body, rebuilt at most once per second
+_health_cache = (0, b'')  # (second, body), swapped as one tuple
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'service': 'mets-homerun-tracker'
-    })
+    global _health_cache
+    sec = int(time.time())
+    cached_sec, body = _health_cache
+    if cached_sec != sec:
+        body = orjson.dumps({
+            'status': 'healthy',
+            'timestamp': datetime.now().isoformat(),
+            'service': 'mets-homerun-tracker'
+        })
+        _health_cache = (sec, body)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/ping')
 def ping():
     """Keep-alive ping endpoint"""
-    keep_alive_ping()
-    return jsonify({
-        'status': 'pong',
-        'timestamp': datetime.now().isoformat()
-    })
+    global _last_keep_alive
+    # Fire the outbound ping in the background so the response isn't blocked on it,
+    # at most once per KEEP_ALIVE_MIN_INTERVAL however often /ping is hit
+    now = time.monotonic()
+    with _keep_alive_lock:
+        due = now - _last_keep_alive >= KEEP_ALIVE_MIN_INTERVAL
+        if due:
+            _last_keep_alive = now
+    if due:
+        threading.Thread(target=keep_alive_ping, daemon=True).start()
+    return app.response_class(b'pong', mimetype='text/plain')
 
-def main():
-    """Main function"""
-    logger.info("🚀 Starting Mets Home Run Tracker Dashboard...")
-    
-    # Determine if we should auto-start monitoring
+def start_background_services():
+    """Start monitoring unless AUTO_START_MONITORING is disabled"""
     auto_start = os.getenv('AUTO_START_MONITORING', 'true').lower() == 'true'
     
     if auto_start:
         logger.info("🏃 Auto-starting monitoring...")
         start_tracker_thread()
+
+def main():
+    """Main function (local development server; production runs under gunicorn)"""
+    logger.info("🚀 Starting Mets Home Run Tracker Dashboard...")
+    
+    # Determine if we should auto-start monitoring
+    start_background_services()
     
     # Start Flask app
     port = int(os.getenv('PORT', 5000))
@@ -9,16 +9,22 @@ import os
 import sys
 import time
 import json
+import pickle
 import logging
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
 from io import StringIO
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
-import pickle
+from urllib.parse import urlencode
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Set, Tuple, Any
+from collections import OrderedDict, deque
 from dataclasses import dataclass, asdict
 import threading
 import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from baseball_savant_gif_integration import BaseballSavantGIFIntegration
 from discord_integration import discord_poster
 
@@ -33,9 +39,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Home run event names (StatsAPI 'event' and 'eventType' spellings, lowercased)
+_HR_EVENTS = frozenset({'home run', 'home_run'})
+
+# Free list of play record dicts reused across polls (see get_game_plays/monitor_games)
+_PLAY_POOL = deque(maxlen=256)
+
+def _slim_play(play_data: Dict) -> Dict:
+    """Keep only the MLB play fields the GIF/Statcast matching reads"""
+    result = play_data.get('result', {})
+    about = play_data.get('about', {})
+    batter = play_data.get('matchup', {}).get('batter', {})
+    return {
+        'result': {'event': result.get('event', ''), 'description': result.get('description', '')},
+        'about': {'inning': about.get('inning'), 'atBatIndex': about.get('atBatIndex'), 'startTime': about.get('startTime')},
+        'matchup': {'batter': {'id': batter.get('id'), 'fullName': batter.get('fullName', '')}}
+    }
+
+def _slim_game_info(game_info: Dict) -> Dict:
+    """Keep only team and venue names/ids from the feed's gameData"""
+    teams = game_info.get('teams', {})
+    venue = game_info.get('venue', {})
+    return {
+        'teams': {
+            side: {'id': teams.get(side, {}).get('id'), 'name': teams.get(side, {}).get('name', '')}
+            for side in ('home', 'away')
+        },
+        'venue': {'id': venue.get('id'), 'name': venue.get('name', '')}
+    }
+
+# Slotted dataclasses need Python 3.10+; the deployed image still runs 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class MetsHomeRun:
-    """Represents a Mets home run queued for GIF processing"""
+    """Represents a Mets home run queued for GIF processing
+    
+    Compared by identity (eq=False) so queue membership checks don't walk
+    every field, including the nested play data.
+    """
     play_id: str
     game_id: int
     game_date: str
@@ -57,6 +99,7 @@ class MetsHomeRun:
     gif_attempts: int = 0
     max_attempts: int = 5
     last_attempt: Optional[datetime] = None
+    last_attempt_monotonic: float = 0.0  # time.monotonic() of last attempt, for rate limiting
     gif_created: bool = False
     posted: bool = False
     gif_path: Optional[str] = None
@@ -76,6 +119,9 @@ class MetsHomeRun:
             data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         if data['last_attempt']:
             data['last_attempt'] = datetime.fromisoformat(data['last_attempt'])
+            # Monotonic clocks don't survive restarts; rebase from the wall-clock time
+            elapsed = (datetime.now() - data['last_attempt']).total_seconds()
+            data['last_attempt_monotonic'] = time.monotonic() - elapsed
         return cls(**data)
 
 class MetsHomeRunTracker:
@@ -84,15 +130,43 @@ class MetsHomeRunTracker:
         self.schedule_api_base = "https://statsapi.mlb.com/api/v1"
         self.gif_integration = BaseballSavantGIFIntegration()
         
+        # HTTP session and conditional-GET cache: url -> (etag, last_modified, parsed_json)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        ))
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        self._http_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+        self._http_cache_lock = threading.Lock()  # shared by the _fetch_pool threads
+        self.max_http_cache_entries = 32
+        
+        # Per-game feed fetches run concurrently; kept small to respect MLB rate limits
+        self._fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mets-feed')
+        
+        # Highest completed atBatIndex already scanned, per game
+        self._last_ab_index: Dict[int, int] = {}
+        
         # Queue management
         self.homerun_queue: List[MetsHomeRun] = []
-        self.processed_plays: Set[str] = set()
-        self.queue_file = "mets_homerun_queue.pkl"
+        self.processed_plays: OrderedDict[str, None] = OrderedDict()  # insertion-ordered for FIFO eviction
+        self.queue_file = "mets_homerun_queue.json"
+        self.legacy_queue_file = "mets_homerun_queue.pkl"  # pre-JSON queue, imported once
+        self.journal_file = self.queue_file + ".wal"
+        self.journal = None
+        self.journal_entries = 0
+        self.journal_compact_every = 10  # Rewrite the snapshot after this many journal entries
+        self._queue_dirty = False  # Unsaved attempt/progress changes, flushed once per cycle
+        # Serializes journal appends and snapshots (monitor thread vs. stop_monitoring);
+        # reentrant because append_journal compacts through save_queue
+        self._queue_lock = threading.RLock()
         self.max_queue_size = 20  # More generous for HRs
         self.max_processed_plays = 200
         
         # Monitoring state
         self.monitoring = False
+        self._stop_event = threading.Event()
         self.processing_gifs = False
         
         # Mets team ID
@@ -109,39 +183,152 @@ class MetsHomeRunTracker:
         self.load_queue()
         
     def load_queue(self):
-        """Load the home run queue from disk"""
+        """Load the home run queue from disk (snapshot plus journal replay)"""
         try:
             if os.path.exists(self.queue_file):
                 with open(self.queue_file, 'rb') as f:
-                    data = pickle.load(f)
-                    self.homerun_queue = [MetsHomeRun.from_dict(hr_data) for hr_data in data.get('queue', [])]
-                    self.processed_plays = set(data.get('processed_plays', []))
-                    logger.info(f"🏠 Loaded {len(self.homerun_queue)} Mets HRs from queue")
+                    data = orjson.loads(f.read())
+                self.homerun_queue = [MetsHomeRun.from_dict(hr_data) for hr_data in data.get('queue', [])]
+                self.processed_plays = OrderedDict.fromkeys(data.get('processed_plays', []))
+                logger.info(f"🏠 Loaded {len(self.homerun_queue)} Mets HRs from queue")
+            elif os.path.exists(self.legacy_queue_file):
+                self.import_legacy_queue()
             else:
                 logger.info("🏠 No existing queue file, starting fresh")
+            
+            self.replay_journal()
         except Exception as e:
             logger.error(f"Error loading queue: {e}")
             self.homerun_queue = []
-            self.processed_plays = set()
+            self.processed_plays = OrderedDict()
+    
+    def import_legacy_queue(self):
+        """Carry HRs over from the old pickle queue into a JSON snapshot"""
+        with open(self.legacy_queue_file, 'rb') as f:
+            data = pickle.load(f)
+        self.homerun_queue = [MetsHomeRun.from_dict(hr_data) for hr_data in data.get('queue', [])]
+        self.processed_plays = OrderedDict.fromkeys(data.get('processed_plays', []))
+        
+        self.save_queue()
+        os.replace(self.legacy_queue_file, self.legacy_queue_file + ".migrated")
+        logger.info(f"🏠 Migrated {len(self.homerun_queue)} Mets HRs from {self.legacy_queue_file}")
+    
+    def replay_journal(self):
+        """Apply journal entries written since the last snapshot"""
+        if not os.path.exists(self.journal_file):
+            return
+        
+        replayed = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A torn final line from an interrupted write
+                    logger.warning("Skipping unreadable queue journal entry")
+                    continue
+                
+                if entry['op'] == 'add':
+                    home_run = MetsHomeRun.from_dict(entry['home_run'])
+                    if not any(hr.play_id == home_run.play_id for hr in self.homerun_queue):
+                        self.homerun_queue.append(home_run)
+                    self.processed_plays[home_run.play_id] = None
+                elif entry['op'] == 'remove':
+                    self.homerun_queue = [hr for hr in self.homerun_queue if hr.play_id != entry['play_id']]
+                replayed += 1
+        
+        self.journal_entries = replayed
+        if replayed:
+            logger.info(f"🏠 Replayed {replayed} queue journal entries")
+    
+    def append_journal(self, entry: Dict):
+        """Durably append one queue change, compacting into a snapshot periodically"""
+        with self._queue_lock:
+            try:
+                if self.journal is None:
+                    self.journal = open(self.journal_file, 'ab')
+                self.journal.write(orjson.dumps(entry) + b"\n")
+                self.journal.flush()
+                os.fsync(self.journal.fileno())
+                self.journal_entries += 1
+            except Exception as e:
+                logger.error(f"Error writing queue journal: {e}")
+                return
+            
+            if self.journal_entries >= self.journal_compact_every:
+                self.save_queue()
     
     def save_queue(self):
-        """Save the home run queue to disk"""
-        try:
-            data = {
-                'queue': [hr.to_dict() for hr in self.homerun_queue],
-                'processed_plays': list(self.processed_plays),
-                'saved_at': datetime.now().isoformat()
-            }
-            with open(self.queue_file, 'wb') as f:
-                pickle.dump(data, f)
-        except Exception as e:
-            logger.error(f"Error saving queue: {e}")
+        """Save a full snapshot of the home run queue to disk and reset the journal"""
+        with self._queue_lock:
+            try:
+                data = {
+                    'queue': self.homerun_queue,
+                    'processed_plays': list(self.processed_plays),
+                    'saved_at': datetime.now()
+                }
+                tmp_file = self.queue_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.queue_file)
+                
+                # Make the rename itself durable before the journal is dropped
+                dir_fd = os.open(os.path.dirname(os.path.abspath(self.queue_file)), os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                self._queue_dirty = False
+                
+                # The snapshot now covers everything in the journal
+                if self.journal is None:
+                    self.journal = open(self.journal_file, 'ab')
+                self.journal.truncate(0)
+                self.journal_entries = 0
+            except Exception as e:
+                logger.error(f"Error saving queue: {e}")
     
-    def get_live_mets_games(self) -> List[Dict]:
+    def get_json(self, url: str, params: Optional[Dict] = None) -> Any:
+        """GET a JSON endpoint, revalidating with ETag/Last-Modified and reusing the cached body on 304"""
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        with self._http_cache_lock:
+            cached = self._http_cache.get(cache_key)
+        
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(url, params=params, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            return cached[2]
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._http_cache_lock:
+                self._http_cache.pop(cache_key, None)
+                if len(self._http_cache) >= self.max_http_cache_entries:
+                    # Evict the least recently stored entry
+                    self._http_cache.pop(next(iter(self._http_cache)), None)
+                self._http_cache[cache_key] = (etag, last_modified, data)
+        
+        return data
+    
+    def get_live_mets_games(self, now: Optional[datetime] = None) -> List[Dict]:
         """Get all Mets games currently live or recently finished"""
         try:
             live_games = []
-            today = datetime.now()
+            today = now or datetime.now()
+            today_utc = today.astimezone(timezone.utc)
             
             # Check today and yesterday for games
             check_dates = [
@@ -149,22 +336,23 @@ class MetsHomeRunTracker:
                 (today - timedelta(days=1)).strftime('%Y-%m-%d')
             ]
             
+            # Request both dates' schedules at once on the fetch pool
+            url = f"{self.schedule_api_base}/schedule"
+            schedule_futures = {}
+            for date_str in check_dates:
+                params = {
+                    'sportId': 1,
+                    'date': date_str,
+                    'teamId': self.mets_team_id,  # Filter for Mets games only
+                    'hydrate': 'linescore,decisions,team',
+                    'useLatestGames': 'false',
+                    'language': 'en'
+                }
+                schedule_futures[date_str] = self._fetch_pool.submit(self.get_json, url, params=params)
+            
             for date_str in check_dates:
                 try:
-                    url = f"{self.schedule_api_base}/schedule"
-                    params = {
-                        'sportId': 1,
-                        'date': date_str,
-                        'teamId': self.mets_team_id,  # Filter for Mets games only
-                        'hydrate': 'linescore,decisions,team',
-                        'useLatestGames': 'false',
-                        'language': 'en'
-                    }
-                    
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    
-                    data = response.json()
+                    data = schedule_futures[date_str].result()
                     
                     for date_data in data.get('dates', []):
                         for game in date_data.get('games', []):
@@ -177,8 +365,10 @@ class MetsHomeRunTracker:
                                     game_time = game.get('gameDate', '')
                                     if game_time:
                                         try:
-                                            game_dt = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
-                                            hours_since = (datetime.now(game_dt.tzinfo) - game_dt).total_seconds() / 3600
+                                            if game_time.endswith('Z'):
+                                                game_time = game_time[:-1] + '+00:00'
+                                            game_dt = datetime.fromisoformat(game_time)
+                                            hours_since = ((today_utc if game_dt.tzinfo else today) - game_dt).total_seconds() / 3600
                                             if hours_since > 3:
                                                 continue
                                         except:
@@ -199,41 +389,63 @@ class MetsHomeRunTracker:
             return []
     
     def get_game_plays(self, game_id: int) -> List[Dict]:
-        """Get all plays from a specific game"""
+        """Get home run plays from a specific game not yet scanned by a previous call"""
         try:
             url = f"{self.api_base}/game/{game_id}/feed/live"
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.get_json(url)
             plays = []
             
             live_plays = data.get('liveData', {}).get('plays', {}).get('allPlays', [])
             game_info = data.get('gameData', {})
             
+            last_index = self._last_ab_index.get(game_id, -1)
+            high_water = last_index
+            advancing = True
+            
             for play in live_plays:
                 about = play.get('about', {})
+                ab_index = about.get('atBatIndex', 0)
+                if ab_index <= last_index:
+                    continue
+                
+                # Only move the mark past finished at-bats so an in-progress
+                # at-bat is rescanned once its result is known
+                if advancing and about.get('isComplete'):
+                    high_water = ab_index
+                else:
+                    advancing = False
+                
+                # Cheap event check before building the full play record
                 result = play.get('result', {})
+                event = result.get('event', '')
+                if event.lower() not in _HR_EVENTS:
+                    continue
+                
                 matchup = play.get('matchup', {})
                 
-                play_data = {
-                    'game_id': game_id,
-                    'play_id': about.get('atBatIndex', 0),
-                    'inning': about.get('inning', 0),
-                    'half_inning': about.get('halfInning', ''),
-                    'description': result.get('description', ''),
-                    'event': result.get('event', ''),
-                    'home_score': result.get('homeScore', 0),
-                    'away_score': result.get('awayScore', 0),
-                    'batter': matchup.get('batter', {}).get('fullName', ''),
-                    'batter_team_id': matchup.get('batter', {}).get('team', {}).get('id'),
-                    'pitcher': matchup.get('pitcher', {}).get('fullName', ''),
-                    'timestamp': about.get('startTime', ''),
-                    'play_data': play,
-                    'game_info': game_info
-                }
+                try:
+                    play_data = _PLAY_POOL.pop()
+                except IndexError:
+                    play_data = {}
+                
+                batter = matchup.get('batter', {})
+                play_data['game_id'] = game_id
+                play_data['play_id'] = about.get('atBatIndex', 0)
+                play_data['inning'] = about.get('inning', 0)
+                play_data['half_inning'] = about.get('halfInning', '')
+                play_data['description'] = result.get('description', '')
+                play_data['event'] = event
+                play_data['home_score'] = result.get('homeScore', 0)
+                play_data['away_score'] = result.get('awayScore', 0)
+                play_data['batter'] = batter.get('fullName', '')
+                play_data['batter_team_id'] = batter.get('team', {}).get('id')
+                play_data['pitcher'] = matchup.get('pitcher', {}).get('fullName', '')
+                play_data['timestamp'] = about.get('startTime', '')
+                play_data['play_data'] = play
+                play_data['game_info'] = game_info
                 plays.append(play_data)
             
+            self._last_ab_index[game_id] = high_water
             return plays
             
         except Exception as e:
@@ -242,22 +454,15 @@ class MetsHomeRunTracker:
     
     def is_mets_home_run(self, play: Dict) -> bool:
         """Check if this is a Mets home run"""
-        event = play.get('event', '').lower()
-        batter_team_id = play.get('batter_team_id')
-        
-        # Must be a home run event and batter must be on the Mets
-        is_home_run = 'home_run' in event or event == 'home run'
-        is_mets_batter = batter_team_id == self.mets_team_id
-        
-        if is_home_run and is_mets_batter:
-            logger.info(f"⚾ METS HOME RUN: {play.get('batter')} - {play.get('description')}")
-            return True
-        
-        return False
+        # Batter must be on the Mets (cheap int check first) and the event must be a home run
+        if play.get('batter_team_id') != self.mets_team_id:
+            return False
+        return play.get('event', '').lower() in _HR_EVENTS
     
-    def queue_mets_home_run(self, play: Dict, game_info: Dict):
+    def queue_mets_home_run(self, play: Dict, game_info: Dict, now: Optional[datetime] = None):
         """Queue a Mets home run for GIF processing"""
         try:
+            now = now or datetime.now()
             play_key = f"{play['game_id']}_{play['play_id']}"
             
             # Avoid duplicates
@@ -269,7 +474,7 @@ class MetsHomeRunTracker:
             home_run = MetsHomeRun(
                 play_id=play_key,
                 game_id=play['game_id'],
-                game_date=datetime.now().strftime('%Y-%m-%d'),
+                game_date=now.strftime('%Y-%m-%d'),
                 description=play['description'],
                 batter=play['batter'],
                 pitcher=play['pitcher'],
@@ -279,14 +484,14 @@ class MetsHomeRunTracker:
                 away_team=game_info.get('teams', {}).get('away', {}).get('name', ''),
                 home_score=play['home_score'],
                 away_score=play['away_score'],
-                timestamp=datetime.now(),
-                mlb_play_data=play['play_data'],
-                game_info=game_info
+                timestamp=now,
+                mlb_play_data=_slim_play(play['play_data']),
+                game_info=_slim_game_info(game_info)
             )
             
             # Add to queue
             self.homerun_queue.append(home_run)
-            self.processed_plays.add(play_key)
+            self.processed_plays[play_key] = None
             self.homeruns_queued_today += 1
             
             # Maintain queue size
@@ -295,15 +500,14 @@ class MetsHomeRunTracker:
                 logger.info(f"Removed oldest queued HR: {removed.batter}")
             
             # Maintain processed plays size
-            if len(self.processed_plays) > self.max_processed_plays:
-                # Remove oldest 50 entries
-                plays_list = list(self.processed_plays)
-                self.processed_plays = set(plays_list[-self.max_processed_plays + 50:])
+            while len(self.processed_plays) > self.max_processed_plays:
+                self.processed_plays.popitem(last=False)
             
             logger.info(f"🏠⚾ QUEUED METS HR: {home_run.batter} - {home_run.description}")
             logger.info(f"📊 Queue: {len(self.homerun_queue)} HRs, Processed: {len(self.processed_plays)} plays")
             
-            self.save_queue()
+            self.append_journal({'op': 'add', 'home_run': home_run})
+            self._queue_dirty = True
             
         except Exception as e:
             logger.error(f"Error queuing Mets home run: {e}")
@@ -315,22 +519,23 @@ class MetsHomeRunTracker:
             return
         
         self.processing_gifs = True
+        to_remove: Set[int] = set()  # Queue indices to drop once the pass is done
         
         try:
-            for home_run in self.homerun_queue[:]:  # Copy list to avoid modification issues
+            for index in range(len(self.homerun_queue)):
+                home_run = self.homerun_queue[index]
                 if home_run.gif_created and home_run.posted:
                     continue
                 
                 # Skip if too many attempts
                 if home_run.gif_attempts >= home_run.max_attempts:
                     logger.warning(f"Max attempts reached for {home_run.batter} HR")
-                    self.cleanup_completed_homerun(home_run)
+                    self.cleanup_completed_homerun(home_run, index, to_remove)
                     continue
                 
                 # Rate limiting - wait between attempts
-                if home_run.last_attempt:
-                    time_since_attempt = datetime.now() - home_run.last_attempt
-                    if time_since_attempt.total_seconds() < 300:  # 5 minutes between attempts
+                if home_run.last_attempt_monotonic:
+                    if time.monotonic() - home_run.last_attempt_monotonic < 300:  # 5 minutes between attempts
                         continue
                 
                 logger.info(f"🎬 Processing GIF for {home_run.batter} HR (attempt {home_run.gif_attempts + 1})")
@@ -338,6 +543,7 @@ class MetsHomeRunTracker:
                 # Update attempt tracking
                 home_run.gif_attempts += 1
                 home_run.last_attempt = datetime.now()
+                home_run.last_attempt_monotonic = time.monotonic()
                 
                 try:
                     # Create GIF
@@ -362,7 +568,7 @@ class MetsHomeRunTracker:
                             logger.info(f"📱 Posted {home_run.batter} HR to Discord")
                         
                         # Clean up completed home run
-                        self.cleanup_completed_homerun(home_run)
+                        self.cleanup_completed_homerun(home_run, index, to_remove)
                         
                     else:
                         logger.warning(f"❌ Failed to create GIF for {home_run.batter} HR")
@@ -370,8 +576,8 @@ class MetsHomeRunTracker:
                 except Exception as e:
                     logger.error(f"Error processing {home_run.batter} HR: {e}")
                 
-                # Save progress
-                self.save_queue()
+                # Progress is flushed once per monitoring cycle
+                self._queue_dirty = True
                 
                 # Small delay between processing
                 time.sleep(2)
@@ -379,8 +585,28 @@ class MetsHomeRunTracker:
         except Exception as e:
             logger.error(f"Error in GIF processing: {e}")
         finally:
+            if to_remove:
+                removed = [self.homerun_queue[i] for i in sorted(to_remove)]
+                self.homerun_queue = [hr for i, hr in enumerate(self.homerun_queue) if i not in to_remove]
+                # Journal only once the queue is rebuilt, so a compaction here can't
+                # snapshot a removed HR and then truncate away its remove entry
+                for home_run in removed:
+                    self.append_journal({'op': 'remove', 'play_id': home_run.play_id})
             self.processing_gifs = False
     
+    def get_statcast_data(self, home_run: MetsHomeRun) -> Optional[Dict]:
+        """Get the Statcast row for a home run
+
+        The game's CSV download is shared with the GIF step through the
+        integration's per-game row cache.
+        """
+        return self.gif_integration.get_statcast_data_for_play(
+            home_run.game_id,
+            home_run.play_id.split('_')[1] if '_' in home_run.play_id else 0,
+            home_run.game_date,
+            home_run.mlb_play_data
+        ) or None
+    
     def post_to_discord(self, home_run: MetsHomeRun) -> bool:
         """Post home run GIF to Discord"""
         try:
@@ -391,12 +617,7 @@ class MetsHomeRunTracker:
             # Get Statcast data for exit velocity and launch angle
             stats_line = ""
             try:
-                statcast_data = self.gif_integration.get_statcast_data_for_play(
-                    home_run.game_id,
-                    home_run.play_id.split('_')[1] if '_' in home_run.play_id else 0,
-                    home_run.game_date,
-                    home_run.mlb_play_data
-                )
+                statcast_data = self.get_statcast_data(home_run)
                 
                 if statcast_data:
                     stat_parts = []
@@ -453,11 +674,21 @@ class MetsHomeRunTracker:
             logger.error(f"Error posting to Discord: {e}")
             return False
     
-    def cleanup_completed_homerun(self, home_run: MetsHomeRun):
-        """Remove completed home run from queue and clean up files"""
+    def cleanup_completed_homerun(self, home_run: MetsHomeRun, index: Optional[int] = None,
+                                  to_remove: Optional[Set[int]] = None):
+        """Remove completed home run from queue and clean up files
+        
+        When called from a queue pass with its index and removal set, the
+        removal (and its journal entry) is deferred to the end of the pass
+        instead of done in place.
+        """
         try:
-            if home_run in self.homerun_queue:
+            if to_remove is not None:
+                to_remove.add(index)
+                logger.info(f"🧹 Cleaned up completed HR: {home_run.batter}")
+            elif home_run in self.homerun_queue:
                 self.homerun_queue.remove(home_run)
+                self.append_journal({'op': 'remove', 'play_id': home_run.play_id})
                 logger.info(f"🧹 Cleaned up completed HR: {home_run.batter}")
             
             # Clean up GIF file after posting
@@ -475,15 +706,17 @@ class MetsHomeRunTracker:
         """Main monitoring loop for Mets home runs"""
         logger.info("🚀 Starting Mets Home Run monitoring...")
         self.monitoring = True
+        self._stop_event.clear()
         self.start_time = datetime.now()
         
-        # Set up graceful shutdown
+        # Set up graceful shutdown (signal handlers can only be installed from the main thread)
         def signal_handler(signum, frame):
             logger.info("📤 Shutdown signal received")
             self.stop_monitoring()
         
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, signal_handler)
+            signal.signal(signal.SIGINT, signal_handler)
         
         try:
             while self.monitoring:
@@ -492,34 +725,41 @@ class MetsHomeRunTracker:
                     logger.info(f"🔍 Checking for Mets games at {self.last_check_time.strftime('%H:%M:%S')}")
                     
                     # Get active Mets games
-                    games = self.get_live_mets_games()
+                    games = self.get_live_mets_games(self.last_check_time)
                     
-                    for game in games:
-                        game_id = game['gamePk']
-                        
-                        # Get plays from this game
-                        plays = self.get_game_plays(game_id)
+                    # Get plays from all games concurrently
+                    futures = [self._fetch_pool.submit(self.get_game_plays, game['gamePk']) for game in games]
+                    
+                    for future in as_completed(futures):
+                        plays = future.result()
                         
                         # Check for Mets home runs
                         for play in plays:
                             if self.is_mets_home_run(play):
-                                self.queue_mets_home_run(play, play['game_info'])
+                                logger.info(f"⚾ METS HOME RUN: {play.get('batter')} - {play.get('description')}")
+                                self.queue_mets_home_run(play, play['game_info'], self.last_check_time)
+                        
+                        # Queued HRs keep their own copies, so the records can be reused
+                        for play in plays:
+                            play.clear()
+                        _PLAY_POOL.extend(plays)
                     
                     # Process GIF queue
                     if self.homerun_queue:
                         logger.info(f"🎬 Processing {len(self.homerun_queue)} HRs in queue")
                         self.process_gif_queue()
                     
-                    # Wait 2 minutes before next check
-                    for i in range(120):  # 2 minutes = 120 seconds
-                        if not self.monitoring:
-                            break
-                        time.sleep(1)
+                    if self._queue_dirty:
+                        self.save_queue()
+                    
+                    # Wait 2 minutes before next check (returns early on stop)
+                    if self._stop_event.wait(120):
+                        break
                     
                 except Exception as e:
                     logger.error(f"Error in monitoring cycle: {e}")
                     # Wait a bit before retrying
-                    time.sleep(30)
+                    self._stop_event.wait(30)
                     
         except KeyboardInterrupt:
             logger.info("⌨️ Keyboard interrupt received")
@@ -530,9 +770,11 @@ class MetsHomeRunTracker:
         """Stop the monitoring system"""
         logger.info("🛑 Stopping Mets Home Run monitoring...")
         self.monitoring = False
+        self._stop_event.set()
         
         # Save final state
         self.save_queue()
+        self.session.close()
         
         logger.info("✅ Mets Home Run Tracker stopped")
     
@@ -5,13 +5,20 @@ Complete MLB Impact System - Enhanced with GIF Integration
 
 import os
 import time
+import functools
+import importlib
 import logging
 import threading
 from datetime import datetime
-import pytz
-from flask import Flask
-import json
+from zoneinfo import ZoneInfo
+from flask import Flask, Response, redirect
+from flask_compress import Compress
+from werkzeug.serving import make_server
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from string import Template
 
 # Set up logging
 logging.basicConfig(
@@ -20,35 +27,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
+# Initialize Flask app; shared CSS lives in static/ and is browser-cached for an hour
+app = Flask(__name__, static_folder='static')
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
 
-# Eastern timezone
-eastern_tz = pytz.timezone('US/Eastern')
+# Compress HTML/JSON/CSS responses (Brotli preferred, gzip fallback); tiny
+# responses like /health are left alone
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 200
+Compress(app)
+
+# Eastern timezone (stdlib zoneinfo, built once at import)
+EASTERN_TZ = ZoneInfo('US/Eastern')
+
+# Eastern ISO timestamp, reformatted at most once per second: [monotonic time, iso string]
+_time_cache = [0.0, '']
+
+def _now_iso():
+    """Current Eastern time as ISO 8601, cached to one-second resolution"""
+    now = time.monotonic()
+    if now - _time_cache[0] >= 1.0:
+        _time_cache[1] = datetime.now(EASTERN_TZ).isoformat()
+        _time_cache[0] = now
+    return _time_cache[1]
+
+# Tracker classes imported on first use: (module name, class name) -> class
+_TRACKER_CLASSES = {}
+
+def _get_tracker_cls(module_name, class_name):
+    """Import a tracker class once and reuse it on later starts"""
+    key = (module_name, class_name)
+    if key not in _TRACKER_CLASSES:
+        _TRACKER_CLASSES[key] = getattr(importlib.import_module(module_name), class_name)
+    return _TRACKER_CLASSES[key]
 
 class MLBImpactSystem:
     """Complete system for tracking and tweeting MLB impact plays"""
     
     def __init__(self):
         self.enhanced_tracker = None
+        self.basic_tracker = None
         self.is_running = False
+        
+        # Tracker loop runs on a supervising daemon thread so crashes surface and get
+        # restarted, without a non-daemon worker holding up process exit
         self.tracker_thread = None
+        self.tracker_restart_delay = 30
         self.ping_thread = None
         self.keep_alive = False
+        self.last_health_check = None  # monotonic time of the last /health hit
+        
+        # Keep-alive pings always hit the same host, so reuse one pooled connection
+        self._ping_session = requests.Session()
+        self._ping_session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=2, backoff_factor=1)
+        ))
+        
+        # Short-lived status cache so bursts of dashboard loads share one tracker call
+        self.status_cache_ttl = 1.0
+        self._status_cache = (0.0, None, None)  # (monotonic time, is_running, status)
+        self._status_lock = threading.Lock()
+        
+        # Snapshot pushed by the status thread while the system runs
+        self._status_snapshot = None
+        self._tracker_status = {}  # raw enhanced tracker status from the last build
+        self.status_thread = None
+        self._stop_event = threading.Event()
+        
+        # Serializes start/stop so concurrent /start hits can't spawn two trackers
+        self._lifecycle_lock = threading.Lock()
     
     def start_enhanced_tracking(self):
         """Start the enhanced tracking with GIF integration"""
         try:
-            from enhanced_impact_tracker import EnhancedImpactTracker
+            EnhancedImpactTracker = _get_tracker_cls('enhanced_impact_tracker', 'EnhancedImpactTracker')
             
             self.enhanced_tracker = EnhancedImpactTracker()
             
-            def run_tracker():
-                logger.info("🚀 Starting enhanced impact tracking with GIF integration...")
-                self.enhanced_tracker.monitor_games()
-            
-            self.tracker_thread = threading.Thread(target=run_tracker, daemon=True)
-            self.tracker_thread.start()
+            self._start_tracker_thread(self.enhanced_tracker, "enhanced impact tracking with GIF integration")
             logger.info("✅ Enhanced tracking started in background")
             
         except ImportError as e:
@@ -59,62 +117,143 @@ class MLBImpactSystem:
     def start_basic_tracking(self):
         """Fallback to basic real-time tracking"""
         try:
-            from realtime_impact_tracker import RealTimeImpactTracker
+            RealTimeImpactTracker = _get_tracker_cls('realtime_impact_tracker', 'RealTimeImpactTracker')
             
             self.basic_tracker = RealTimeImpactTracker()
             
-            def run_basic_tracker():
-                logger.info("🚀 Starting basic real-time tracking...")
-                self.basic_tracker.monitor_games()
-            
-            self.tracker_thread = threading.Thread(target=run_basic_tracker, daemon=True)
-            self.tracker_thread.start()
+            self._start_tracker_thread(self.basic_tracker, "basic real-time tracking")
             logger.info("✅ Basic tracking started in background")
             
         except ImportError as e:
             logger.error(f"Failed to import any tracker: {e}")
     
+    def _run_tracker(self, tracker, label):
+        """Tracker thread: run the monitor loop, restarting it if it crashes while the system runs"""
+        while True:
+            logger.info(f"🚀 Starting {label}...")
+            try:
+                tracker.monitor_games()
+                logger.info(f"🛑 {label} loop exited")
+                return
+            except Exception as e:
+                logger.error(f"💥 {label} loop crashed: {e}", exc_info=True)
+            
+            if not self.is_running:
+                return
+            logger.info(f"🔄 Restarting {label} in {self.tracker_restart_delay}s")
+            if self._stop_event.wait(self.tracker_restart_delay):
+                return
+    
+    def _start_tracker_thread(self, tracker, label):
+        """Start the supervised tracker thread"""
+        self.tracker_thread = threading.Thread(target=self._run_tracker, args=(tracker, label),
+                                               name='tracker', daemon=True)
+        self.tracker_thread.start()
+    
     def start_system(self):
-        """Start the complete system"""
-        logger.info("🚨 Starting MLB Impact System...")
-        self.is_running = True
-        
-        # Start enhanced tracking (with fallback)
-        self.start_enhanced_tracking()
-        
-        # Start keep-alive ping service for Render
-        self.start_keep_alive_ping()
-        
-        logger.info("✅ MLB Impact System fully operational!")
+        """Start the complete system; returns False if it was already running"""
+        with self._lifecycle_lock:
+            if self.is_running:
+                logger.info("ℹ️ MLB Impact System already running")
+                return False
+            
+            logger.info("🚨 Starting MLB Impact System...")
+            self.is_running = True
+            self._stop_event.clear()
+            
+            # Start enhanced tracking (with fallback)
+            self.start_enhanced_tracking()
+            
+            # Start keep-alive ping service for Render, unless an external pinger hits /health
+            if os.getenv('KEEP_ALIVE_PING', '1') != '0':
+                self.start_keep_alive_ping()
+            else:
+                logger.info("ℹ️ Self keep-alive ping disabled (KEEP_ALIVE_PING=0); expecting an external /health pinger")
+            
+            # Refresh the status snapshot in the background
+            self.status_thread = threading.Thread(target=self._status_loop, daemon=True)
+            self.status_thread.start()
+            
+            logger.info("✅ MLB Impact System fully operational!")
+            return True
     
     def stop_system(self):
-        """Stop the system"""
-        logger.info("🛑 Stopping MLB Impact System...")
-        self.is_running = False
-        self.keep_alive = False
+        """Stop the system; returns False if it was not running"""
+        with self._lifecycle_lock:
+            if not self.is_running:
+                return False
+            
+            logger.info("🛑 Stopping MLB Impact System...")
+            self.is_running = False
+            self.keep_alive = False
+            self._stop_event.set()
+            self._status_snapshot = None
+            
+            if self.enhanced_tracker is not None:
+                self.enhanced_tracker.stop_monitoring()
+            elif self.basic_tracker is not None:
+                self.basic_tracker.stop_monitoring()
+            
+            self._ping_session.close()
+            
+            logger.info("🛑 All services stopped")
+            return True
+    
+    def _status_loop(self):
+        """Rebuild the status snapshot once a second until the system stops"""
+        while True:
+            try:
+                self._status_snapshot = self._build_status()
+            except Exception as e:
+                logger.error(f"Error refreshing status snapshot: {e}")
+            
+            if self._stop_event.wait(1.0):
+                break
+        self._status_snapshot = None
+    
+    def get_current_status(self):
+        """Get current system status
+        
+        While running, returns the snapshot kept fresh by the status thread;
+        otherwise builds it on demand, cached for status_cache_ttl seconds.
+        """
+        snapshot = self._status_snapshot
+        if snapshot is not None and self.is_running:
+            return snapshot
         
-        if hasattr(self, 'enhanced_tracker') and self.enhanced_tracker:
-            self.enhanced_tracker.stop_monitoring()
-        elif hasattr(self, 'basic_tracker') and self.basic_tracker:
-            self.basic_tracker.stop_monitoring()
+        cached_at, cached_running, cached_status = self._status_cache
+        if cached_status is not None and cached_running == self.is_running and \
+                time.monotonic() - cached_at < self.status_cache_ttl:
+            return cached_status
         
-        logger.info("🛑 All services stopped")
+        with self._status_lock:
+            # Another request may have refreshed the cache while we waited
+            cached_at, cached_running, cached_status = self._status_cache
+            now = time.monotonic()
+            if cached_status is not None and cached_running == self.is_running and \
+                    now - cached_at < self.status_cache_ttl:
+                return cached_status
+            
+            status = self._build_status()
+            self._status_cache = (now, self.is_running, status)
+            return status
     
-    def get_current_status(self):
-        """Get current system status"""
+    def _build_status(self):
+        """Collect system and tracker status"""
         status = {
             'system_running': self.is_running,
-            'enhanced_tracker_active': hasattr(self, 'enhanced_tracker') and self.enhanced_tracker is not None,
+            'enhanced_tracker_active': self.enhanced_tracker is not None,
             'keep_alive_active': self.keep_alive,
-            'current_time': datetime.now(eastern_tz).isoformat(),
-            'tracker_type': 'Enhanced with GIF Integration' if hasattr(self, 'enhanced_tracker') else 'Basic Real-time',
+            'current_time': _now_iso(),
+            'tracker_type': 'Enhanced with GIF Integration' if self.enhanced_tracker is not None else 'Basic Real-time',
             'last_updated': 'Unknown'
         }
         
         # Get status from enhanced tracker if available
-        if hasattr(self, 'enhanced_tracker') and self.enhanced_tracker:
+        if self.enhanced_tracker is not None:
             try:
                 enhanced_status = self.enhanced_tracker.get_status()
+                self._tracker_status = enhanced_status
                 status.update({
                     'monitoring': enhanced_status.get('monitoring', False),
                     'processing_gifs': enhanced_status.get('processing_gifs', False),
@@ -126,9 +265,17 @@ class MLBImpactSystem:
                     'last_check_time': enhanced_status.get('last_check_time', 'Never')
                 })
             except Exception as e:
+                self._tracker_status = {'error': str(e)}
                 logger.error(f"Error getting enhanced tracker status: {e}")
+        else:
+            self._tracker_status = {}
         
         return status
+    
+    def get_tracker_status(self):
+        """Raw enhanced tracker status, shared with the cached system status"""
+        self.get_current_status()
+        return self._tracker_status
 
     def start_keep_alive_ping(self):
         """Start the keep-alive ping to prevent Render spin-down"""
@@ -144,26 +291,32 @@ class MLBImpactSystem:
             
             logger.info(f"🌐 Keep-alive target: {service_url}")
             
+            # Successes are logged on recovery and then hourly; failures always
+            ok_streak = 0
             while self.keep_alive:
                 try:
                     # Ping the health endpoint every 10 minutes
-                    response = requests.get(f"{service_url}/health", timeout=30)
+                    response = self._ping_session.get(f"{service_url}/health", timeout=30)
                     if response.status_code == 200:
-                        logger.info(f"🏓 Keep-alive ping successful ({response.status_code})")
+                        ok_streak += 1
+                        if ok_streak == 1:
+                            logger.info(f"🏓 Keep-alive ping successful ({response.status_code})")
+                        elif ok_streak % 6 == 0:
+                            logger.info(f"🏓 Keep-alive healthy: {ok_streak} successful pings in a row")
                     else:
+                        ok_streak = 0
                         logger.warning(f"🏓 Keep-alive ping returned {response.status_code}")
                         
                 except requests.exceptions.RequestException as e:
+                    ok_streak = 0
                     logger.warning(f"🏓 Keep-alive ping failed: {e}")
                 except Exception as e:
+                    ok_streak = 0
                     logger.error(f"🏓 Keep-alive ping error: {e}")
                 
-                # Wait 10 minutes (600 seconds) before next ping
-                # Use shorter intervals to check if we should stop
-                for _ in range(120):  # 120 * 5 = 600 seconds = 10 minutes
-                    if not self.keep_alive:
-                        break
-                    time.sleep(5)
+                # Wait 10 minutes before next ping; stop_system wakes us immediately
+                if self._stop_event.wait(600):
+                    break
         
         self.keep_alive = True
         self.ping_thread = threading.Thread(target=ping_self, daemon=True)
@@ -173,169 +326,192 @@ class MLBImpactSystem:
 # Global system instance
 mlb_system = MLBImpactSystem()
 
+# Static landing page for the enhanced tracker, served at /loading
+_ENHANCED_ACTIVE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>MLB Enhanced Impact System</title>
+    <link rel="stylesheet" href="/static/dashboard.css">
+</head>
+<body class="enhanced-active">
+    <div class="loading">🎬 Enhanced MLB Impact Tracker Active!</div>
+    <div class="info">✅ System is monitoring for high-impact plays</div>
+    <div class="info">🎥 GIF integration ready</div>
+    <div class="info">🐦 Twitter connected</div>
+    
+    <div style="margin-top: 30px;">
+        <a href="/enhanced" class="button">📊 View Enhanced Dashboard</a>
+        <a href="/debug/status" class="button">🔍 Debug Status</a>
+        <a href="/debug/twitter" class="button">🐦 Twitter Debug</a>
+    </div>
+</body>
+</html>
+"""
+
+# Status rows of the home page; they depend only on a handful of flags
+_STATUS_BLOCK_TMPL = Template("""
+<div class="metric">
+    <strong>Overall Status:</strong> 
+    <span class="$system_class">
+        $system_text
+    </span>
+</div>
+
+<div class="metric">
+    <strong>Game Monitoring:</strong> 
+    <span class="$monitoring_class">
+        $monitoring_text
+    </span>
+</div>
+
+<div class="metric">
+    <strong>GIF Processing:</strong> 
+    <span class="$gifs_class">
+        $gifs_text
+    </span>
+</div>
+
+<div class="metric">
+    <strong>Twitter:</strong> 
+    <span class="$twitter_class">
+        $twitter_text
+    </span>
+</div>
+
+<div class="metric">
+    <strong>Keep-Alive Service:</strong> 
+    <span class="$keep_alive_class">
+        $keep_alive_text
+    </span>
+    <span style="font-size: 0.8em; opacity: 0.7;"> (Prevents Render spin-down)</span>
+</div>
+
+<div class="metric"><strong>Tracker Type:</strong> $tracker_type</div>
+""")
+
+@functools.lru_cache(maxsize=64)
+def _render_status_block(system_running, monitoring, gifs, twitter, keep_alive, tracker_type):
+    """Render the status rows for one combination of flags"""
+    return _STATUS_BLOCK_TMPL.substitute(
+        system_class='active' if system_running else 'inactive',
+        system_text='🟢 SYSTEM RUNNING' if system_running else '🔴 SYSTEM STOPPED',
+        monitoring_class='active' if monitoring else 'inactive',
+        monitoring_text='🟢 ACTIVE' if monitoring else '🔴 INACTIVE',
+        gifs_class='active' if gifs else 'inactive',
+        gifs_text='🟢 RUNNING' if gifs else '🔴 STOPPED',
+        twitter_class='active' if twitter else 'inactive',
+        twitter_text='🟢 CONNECTED' if twitter else '🔴 DISCONNECTED',
+        keep_alive_class='active' if keep_alive else 'inactive',
+        keep_alive_text='🟢 RUNNING' if keep_alive else '🔴 STOPPED',
+        tracker_type=tracker_type
+    )
+
+# Detailed status page; only the $-placeholders change per request
+_HOME_TMPL = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>MLB Impact System</title>
+    <meta http-equiv="refresh" content="15">
+    <link rel="stylesheet" href="/static/dashboard.css">
+</head>
+<body>
+    <h1 class="header">🎯 MLB Impact System</h1>
+    
+    <div class="status">
+        <h3>System Status</h3>
+        $status_block
+        <div class="metric"><strong>Last Check:</strong> $last_check_time</div>
+        <div class="metric"><strong>System Time:</strong> $current_time</div>
+        
+        $queue_line
+        $today_line
+    </div>
+    
+    <div class="buttons">
+        <a href="/enhanced" class="button">📊 Enhanced Dashboard</a>
+        <a href="/debug/status" class="button">🔍 Debug Status</a>
+        <a href="/debug/twitter" class="button">🐦 Twitter Debug</a>
+        <a href="/retry-twitter" class="button">🔄 Retry Twitter</a>
+    </div>
+    
+    <div style="margin-top: 20px; font-size: 0.9em; opacity: 0.7;">
+        Page auto-refreshes every 15 seconds
+    </div>
+</body>
+</html>
+""")
+
+# Rendered pages, cached briefly so bursts of refreshes share one build: name -> (monotonic time, html)
+PAGE_CACHE_TTL = 2.0
+_page_cache = {}
+_page_lock = threading.Lock()
+
+def _cached_page(name, render):
+    """Return render()'s page, rebuilding it at most once per PAGE_CACHE_TTL seconds"""
+    entry = _page_cache.get(name)
+    if entry is not None and time.monotonic() - entry[0] < PAGE_CACHE_TTL:
+        return entry[1]
+    
+    with _page_lock:
+        # Another request may have rebuilt the page while we waited
+        entry = _page_cache.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < PAGE_CACHE_TTL:
+            return entry[1]
+        
+        html = render()
+        _page_cache[name] = (now, html)
+        return html
+
+def _render_home(status):
+    """Fill the detailed status page from a status dict"""
+    return _HOME_TMPL.substitute(
+        status_block=_render_status_block(
+            bool(status['system_running']),
+            bool(status.get('monitoring', False)),
+            bool(status.get('processing_gifs', False)),
+            bool(status.get('twitter_connected', False)),
+            bool(status.get('keep_alive_active', False)),
+            status.get('tracker_type', 'Unknown')
+        ),
+        last_check_time=status.get('last_check_time', 'Never'),
+        current_time=status.get('current_time', 'Unknown'),
+        queue_line=('<div class="metric"><strong>Queue Size:</strong> ' + str(status.get('queue_size', 0)) + ' plays</div>') if 'queue_size' in status else '',
+        today_line=('<div class="metric"><strong>Today - Queued:</strong> ' + str(status.get('plays_queued_today', 0)) + ', GIFs: ' + str(status.get('gifs_created_today', 0)) + ', Tweets: ' + str(status.get('tweets_posted_today', 0)) + '</div>') if 'plays_queued_today' in status else ''
+    )
+
 @app.route('/')
 def home():
     """System status dashboard"""
     try:
         status = mlb_system.get_current_status()
         
-        # Check if we should show enhanced dashboard instead
-        show_enhanced = (hasattr(mlb_system, 'enhanced_tracker') and 
-                        mlb_system.enhanced_tracker and 
-                        status.get('monitoring', False))
+        # Send the browser straight to the enhanced dashboard when it is live
+        show_enhanced = mlb_system.enhanced_tracker is not None and status.get('monitoring', False)
         
         if show_enhanced:
-            return """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>MLB Enhanced Impact System</title>
-                <style>
-                    body { 
-                        font-family: Arial, sans-serif; 
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white; 
-                        text-align: center;
-                        padding: 50px;
-                    }
-                    .loading { font-size: 24px; margin-bottom: 20px; }
-                    .info { font-size: 16px; opacity: 0.8; margin: 10px 0; }
-                    .button { 
-                        display: inline-block; 
-                        background: #ff6b35; 
-                        color: white; 
-                        padding: 10px 20px; 
-                        text-decoration: none; 
-                        border-radius: 5px; 
-                        margin: 10px;
-                    }
-                </style>
-            </head>
-            <body>
-                <div class="loading">🎬 Enhanced MLB Impact Tracker Active!</div>
-                <div class="info">✅ System is monitoring for high-impact plays</div>
-                <div class="info">🎥 GIF integration ready</div>
-                <div class="info">🐦 Twitter connected</div>
-                
-                <div style="margin-top: 30px;">
-                    <a href="/enhanced" class="button">📊 View Enhanced Dashboard</a>
-                    <a href="/debug/status" class="button">🔍 Debug Status</a>
-                    <a href="/debug/twitter" class="button">🐦 Twitter Debug</a>
-                </div>
-            </body>
-            </html>
-            """
+            return redirect('/enhanced', code=302)
         
         # Show detailed status page if enhanced tracker not fully active
-        monitoring_status = status.get('monitoring', False)
-        processing_gifs = status.get('processing_gifs', False)
-        twitter_connected = status.get('twitter_connected', False)
-        keep_alive_active = status.get('keep_alive_active', False)
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>MLB Impact System</title>
-            <meta http-equiv="refresh" content="15">
-            <style>
-                body {{ 
-                    font-family: Arial, sans-serif; 
-                    background: #0f1419; 
-                    color: white; 
-                    padding: 40px;
-                }}
-                .header {{ color: #ff6b35; margin-bottom: 30px; }}
-                .status {{ background: #21262d; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-                .metric {{ margin: 15px 0; padding: 10px; background: #1a1a1a; border-radius: 5px; }}
-                .active {{ color: #28a745; }}
-                .inactive {{ color: #dc3545; }}
-                .warning {{ color: #ffc107; }}
-                .buttons {{ margin-top: 20px; }}
-                .button {{ 
-                    display: inline-block; 
-                    background: #ff6b35; 
-                    color: white; 
-                    padding: 8px 16px; 
-                    text-decoration: none; 
-                    border-radius: 5px; 
-                    margin: 5px;
-                }}
-            </style>
-        </head>
-        <body>
-            <h1 class="header">🎯 MLB Impact System</h1>
-            
-            <div class="status">
-                <h3>System Status</h3>
-                <div class="metric">
-                    <strong>Overall Status:</strong> 
-                    <span class="{'active' if status['system_running'] else 'inactive'}">
-                        {'🟢 SYSTEM RUNNING' if status['system_running'] else '🔴 SYSTEM STOPPED'}
-                    </span>
-                </div>
-                
-                <div class="metric">
-                    <strong>Game Monitoring:</strong> 
-                    <span class="{'active' if monitoring_status else 'inactive'}">
-                        {'🟢 ACTIVE' if monitoring_status else '🔴 INACTIVE'}
-                    </span>
-                </div>
-                
-                <div class="metric">
-                    <strong>GIF Processing:</strong> 
-                    <span class="{'active' if processing_gifs else 'inactive'}">
-                        {'🟢 RUNNING' if processing_gifs else '🔴 STOPPED'}
-                    </span>
-                </div>
-                
-                <div class="metric">
-                    <strong>Twitter:</strong> 
-                    <span class="{'active' if twitter_connected else 'inactive'}">
-                        {'🟢 CONNECTED' if twitter_connected else '🔴 DISCONNECTED'}
-                    </span>
-                </div>
-                
-                <div class="metric">
-                    <strong>Keep-Alive Service:</strong> 
-                    <span class="{'active' if keep_alive_active else 'inactive'}">
-                        {'🟢 RUNNING' if keep_alive_active else '🔴 STOPPED'}
-                    </span>
-                    <span style="font-size: 0.8em; opacity: 0.7;"> (Prevents Render spin-down)</span>
-                </div>
-                
-                <div class="metric"><strong>Tracker Type:</strong> {status.get('tracker_type', 'Unknown')}</div>
-                <div class="metric"><strong>Last Check:</strong> {status.get('last_check_time', 'Never')}</div>
-                <div class="metric"><strong>System Time:</strong> {status.get('current_time', 'Unknown')}</div>
-                
-                {'<div class="metric"><strong>Queue Size:</strong> ' + str(status.get('queue_size', 0)) + ' plays</div>' if 'queue_size' in status else ''}
-                {'<div class="metric"><strong>Today - Queued:</strong> ' + str(status.get('plays_queued_today', 0)) + ', GIFs: ' + str(status.get('gifs_created_today', 0)) + ', Tweets: ' + str(status.get('tweets_posted_today', 0)) + '</div>' if 'plays_queued_today' in status else ''}
-            </div>
-            
-            <div class="buttons">
-                <a href="/enhanced" class="button">📊 Enhanced Dashboard</a>
-                <a href="/debug/status" class="button">🔍 Debug Status</a>
-                <a href="/debug/twitter" class="button">🐦 Twitter Debug</a>
-                <a href="/retry-twitter" class="button">🔄 Retry Twitter</a>
-            </div>
-            
-            <div style="margin-top: 20px; font-size: 0.9em; opacity: 0.7;">
-                Page auto-refreshes every 15 seconds
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        html = _cached_page('home', lambda: _render_home(status))
+        return Response(html, mimetype='text/html')
         
     except Exception as e:
         logger.error(f"Error in dashboard: {e}")
         return f"<h1>System Error</h1><p>{str(e)}</p>"
 
+@app.route('/loading')
+def loading():
+    """Enhanced tracker landing page"""
+    return Response(_ENHANCED_ACTIVE_HTML, mimetype='text/html')
+
 @app.route('/enhanced')
 def enhanced_dashboard():
     """Redirect to enhanced dashboard if available"""
     try:
-        if hasattr(mlb_system, 'enhanced_tracker') and mlb_system.enhanced_tracker:
+        if mlb_system.enhanced_tracker is not None:
             # Import and serve enhanced dashboard
             from enhanced_dashboard import dashboard
             return dashboard()
@@ -344,92 +520,112 @@ def enhanced_dashboard():
     except Exception as e:
         return f"<h1>Enhanced Dashboard Error</h1><p>{str(e)}</p>"
 
+# Twitter debug page; the credential rows and summary are filled in per request
+_DEBUG_TWITTER_TMPL = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Twitter Credentials Debug</title>
+    <link rel="stylesheet" href="/static/dashboard.css">
+</head>
+<body class="debug">
+    <h1>🐦 Twitter Credentials Status</h1>
+    
+    <div class="section">
+        <h3>Required Credentials (with fallback naming):</h3>
+        $credential_rows
+    </div>
+    
+    <div class="summary $summary_class">
+        <strong>Overall Status: $summary_text</strong>
+    </div>
+    
+    <div class="section">
+        <h3>Individual Environment Variables:</h3>
+        <div class="small">Shows exactly which variables are set in your environment:</div>
+        $individual_rows
+    </div>
+    
+    <div class="section small">
+        <strong>Note:</strong> The system will use TWITTER_API_KEY if TWITTER_CONSUMER_KEY is not found, and TWITTER_API_SECRET if TWITTER_CONSUMER_SECRET is not found.
+    </div>
+    
+    <p style="margin-top: 20px;">
+        <a href="/" style="color: #ff6b35;">← Back to Dashboard</a> | 
+        <a href="/retry-twitter" style="color: #ff6b35;">Retry Twitter Auth</a>
+    </p>
+</body>
+</html>
+""")
+
+# Twitter env vars read by the debug page
+_TWITTER_ENV_VARS = (
+    'TWITTER_CONSUMER_KEY', 'TWITTER_API_KEY',
+    'TWITTER_CONSUMER_SECRET', 'TWITTER_API_SECRET',
+    'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_TOKEN_SECRET',
+    'TWITTER_BEARER_TOKEN'
+)
+
+# Debug-page label -> env vars accepted for it, in fallback order
+_TWITTER_CREDENTIAL_ALIASES = (
+    ('TWITTER_CONSUMER_KEY / TWITTER_API_KEY', ('TWITTER_CONSUMER_KEY', 'TWITTER_API_KEY')),
+    ('TWITTER_CONSUMER_SECRET / TWITTER_API_SECRET', ('TWITTER_CONSUMER_SECRET', 'TWITTER_API_SECRET')),
+    ('TWITTER_ACCESS_TOKEN', ('TWITTER_ACCESS_TOKEN',)),
+    ('TWITTER_ACCESS_TOKEN_SECRET', ('TWITTER_ACCESS_TOKEN_SECRET',)),
+    ('TWITTER_BEARER_TOKEN (optional)', ('TWITTER_BEARER_TOKEN',))
+)
+
+# Credential row markup keyed by presence; only the name and label vary
+_CREDENTIAL_ROW = {
+    True: '<div class="credential present">✅ {}: {}</div>',
+    False: '<div class="credential missing">❌ {}: {}</div>'
+}
+
+# Every row the debug page can show, prebuilt: (name, present) -> html
+_CREDENTIAL_DIVS = {
+    (label, present): _CREDENTIAL_ROW[present].format(label, 'Present' if present else 'Missing')
+    for label, _ in _TWITTER_CREDENTIAL_ALIASES for present in (True, False)
+}
+_ENV_VAR_DIVS = {
+    (name, present): _CREDENTIAL_ROW[present].format(name, 'Set' if present else 'Not Set')
+    for name in _TWITTER_ENV_VARS for present in (True, False)
+}
+
+@functools.lru_cache(maxsize=1)
+def _twitter_env_snapshot():
+    """Which Twitter env vars are set (never their values); cleared by /retry-twitter"""
+    env = os.environ
+    return {name: bool(env.get(name)) for name in _TWITTER_ENV_VARS}
+
 @app.route('/debug/twitter')
 def debug_twitter():
     """Debug Twitter credentials (shows presence, not values)"""
-    import os
+    individual_vars = _twitter_env_snapshot()
     
     # Check for both naming conventions
-    consumer_key = os.getenv('TWITTER_CONSUMER_KEY') or os.getenv('TWITTER_API_KEY')
-    consumer_secret = os.getenv('TWITTER_CONSUMER_SECRET') or os.getenv('TWITTER_API_SECRET')
-    access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-    access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-    bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-    
     credentials = {
-        'TWITTER_CONSUMER_KEY / TWITTER_API_KEY': bool(consumer_key),
-        'TWITTER_CONSUMER_SECRET / TWITTER_API_SECRET': bool(consumer_secret),
-        'TWITTER_ACCESS_TOKEN': bool(access_token),
-        'TWITTER_ACCESS_TOKEN_SECRET': bool(access_token_secret),
-        'TWITTER_BEARER_TOKEN (optional)': bool(bearer_token)
-    }
-    
-    # Check individual variables for detailed view
-    individual_vars = {
-        'TWITTER_CONSUMER_KEY': bool(os.getenv('TWITTER_CONSUMER_KEY')),
-        'TWITTER_API_KEY': bool(os.getenv('TWITTER_API_KEY')),
-        'TWITTER_CONSUMER_SECRET': bool(os.getenv('TWITTER_CONSUMER_SECRET')),
-        'TWITTER_API_SECRET': bool(os.getenv('TWITTER_API_SECRET')),
-        'TWITTER_ACCESS_TOKEN': bool(os.getenv('TWITTER_ACCESS_TOKEN')),
-        'TWITTER_ACCESS_TOKEN_SECRET': bool(os.getenv('TWITTER_ACCESS_TOKEN_SECRET')),
-        'TWITTER_BEARER_TOKEN': bool(os.getenv('TWITTER_BEARER_TOKEN'))
+        label: any(individual_vars[name] for name in names)
+        for label, names in _TWITTER_CREDENTIAL_ALIASES
     }
     
     # Check if required credentials are available
-    required_present = consumer_key and consumer_secret and access_token and access_token_secret
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Twitter Credentials Debug</title>
-        <style>
-            body {{ font-family: Arial; background: #0f1419; color: white; padding: 20px; }}
-            .credential {{ margin: 10px 0; padding: 10px; border-radius: 5px; }}
-            .present {{ background: #28a745; }}
-            .missing {{ background: #dc3545; }}
-            .summary {{ margin-top: 20px; padding: 15px; border-radius: 5px; }}
-            .section {{ margin: 20px 0; padding: 15px; background: #21262d; border-radius: 8px; }}
-            .small {{ font-size: 0.9em; opacity: 0.8; }}
-        </style>
-    </head>
-    <body>
-        <h1>🐦 Twitter Credentials Status</h1>
-        
-        <div class="section">
-            <h3>Required Credentials (with fallback naming):</h3>
-            {''.join([f'<div class="credential {"present" if present else "missing"}">{"✅" if present else "❌"} {name}: {"Present" if present else "Missing"}</div>' for name, present in credentials.items()])}
-        </div>
-        
-        <div class="summary {'present' if required_present else 'missing'}">
-            <strong>Overall Status: {'✅ All required credentials present' if required_present else '❌ Some required credentials missing'}</strong>
-        </div>
-        
-        <div class="section">
-            <h3>Individual Environment Variables:</h3>
-            <div class="small">Shows exactly which variables are set in your environment:</div>
-            {''.join([f'<div class="credential {"present" if present else "missing"}">{"✅" if present else "❌"} {name}: {"Set" if present else "Not Set"}</div>' for name, present in individual_vars.items()])}
-        </div>
-        
-        <div class="section small">
-            <strong>Note:</strong> The system will use TWITTER_API_KEY if TWITTER_CONSUMER_KEY is not found, and TWITTER_API_SECRET if TWITTER_CONSUMER_SECRET is not found.
-        </div>
-        
-        <p style="margin-top: 20px;">
-            <a href="/" style="color: #ff6b35;">← Back to Dashboard</a> | 
-            <a href="/retry-twitter" style="color: #ff6b35;">Retry Twitter Auth</a>
-        </p>
-    </body>
-    </html>
-    """
+    required_present = all(present for label, present in credentials.items() if not label.endswith('(optional)'))
     
-    return html
+    html = _DEBUG_TWITTER_TMPL.substitute(
+        credential_rows=''.join(_CREDENTIAL_DIVS[row] for row in credentials.items()),
+        summary_class='present' if required_present else 'missing',
+        summary_text='✅ All required credentials present' if required_present else '❌ Some required credentials missing',
+        individual_rows=''.join(_ENV_VAR_DIVS[row] for row in individual_vars.items())
+    )
+    
+    return Response(html, mimetype='text/html')
 
 @app.route('/retry-twitter')
 def retry_twitter():
     """Manually retry Twitter authentication"""
+    _twitter_env_snapshot.cache_clear()
     try:
-        if hasattr(mlb_system, 'enhanced_tracker') and mlb_system.enhanced_tracker:
+        if mlb_system.enhanced_tracker is not None:
             success = mlb_system.enhanced_tracker.retry_twitter_setup()
             if success:
                 return "✅ Twitter authentication successful!"
@@ -440,16 +636,26 @@ def retry_twitter():
     except Exception as e:
         return f"❌ Error during Twitter retry: {str(e)}"
 
+# Pre-serialized /health body, rebuilt at most once per second
+_health_cache = (0, b'')  # (second, body), swapped as one tuple
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return {'status': 'healthy', 'timestamp': str(datetime.now())}
+    global _health_cache
+    mlb_system.last_health_check = time.monotonic()
+    sec = int(time.time())
+    cached_sec, body = _health_cache
+    if cached_sec != sec:
+        body = orjson.dumps({'status': 'healthy', 'timestamp': _now_iso()})
+        _health_cache = (sec, body)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/start')
 def start_system():
     """Start the system"""
-    if not mlb_system.is_running:
-        mlb_system.start_system()
+    if mlb_system.start_system():
+        _page_cache.clear()
         return "✅ System started!"
     else:
         return "ℹ️ System already running"
@@ -457,91 +663,108 @@ def start_system():
 @app.route('/stop')
 def stop_system():
     """Stop the system"""
-    if mlb_system.is_running:
-        mlb_system.stop_system()
+    if mlb_system.stop_system():
+        _page_cache.clear()
         return "🛑 System stopped!"
     else:
         return "ℹ️ System not running"
 
+# Debug status page; the three JSON dumps are filled in per render
+_DEBUG_STATUS_TMPL = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>System Status Debug</title>
+    <meta http-equiv="refresh" content="10">
+    <link rel="stylesheet" href="/static/dashboard.css">
+</head>
+<body class="debug">
+    <h1>🔍 System Status Debug</h1>
+    
+    <div class="section">
+        <h3>System Status:</h3>
+        <pre>$status_json</pre>
+    </div>
+    
+    <div class="section">
+        <h3>Debug Info:</h3>
+        <pre>$debug_info_json</pre>
+    </div>
+    
+    <div class="section">
+        <h3>Enhanced Tracker Status:</h3>
+        <pre>$enhanced_status_json</pre>
+    </div>
+    
+    <p><a href="/" style="color: #ff6b35;">← Back to Dashboard</a></p>
+</body>
+</html>
+""")
+
+def _pretty_json(obj):
+    """Indented JSON for the debug page; non-JSON values fall back to str()"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _render_debug_status():
+    """Build the detailed debug status page"""
+    status = mlb_system.get_current_status()
+    
+    # Get additional debug info
+    debug_info = {
+        'mlb_system_is_running': mlb_system.is_running,
+        'has_enhanced_tracker': mlb_system.enhanced_tracker is not None,
+        'enhanced_tracker_not_none': mlb_system.enhanced_tracker is not None,
+        'tracker_thread_alive': mlb_system.tracker_thread.is_alive() if mlb_system.tracker_thread else False,
+        'keep_alive_active': mlb_system.keep_alive,
+        'ping_thread_alive': mlb_system.ping_thread.is_alive() if mlb_system.ping_thread else False,
+        'seconds_since_health_check': round(time.monotonic() - mlb_system.last_health_check) if mlb_system.last_health_check is not None else 'Never',
+        'render_external_url': os.getenv('RENDER_EXTERNAL_URL', 'Not set'),
+        'render_service_name': os.getenv('RENDER_SERVICE_NAME', 'Not set')
+    }
+    
+    # Enhanced tracker status from the same cached build as the system status
+    enhanced_status = mlb_system.get_tracker_status()
+    
+    return _DEBUG_STATUS_TMPL.substitute(
+        status_json=_pretty_json(status),
+        debug_info_json=_pretty_json(debug_info),
+        enhanced_status_json=_pretty_json(enhanced_status)
+    )
+
 @app.route('/debug/status')
 def debug_status():
     """Debug system status in detail"""
     try:
-        import os
-        status = mlb_system.get_current_status()
-        
-        # Get additional debug info
-        debug_info = {
-            'mlb_system_is_running': mlb_system.is_running,
-            'has_enhanced_tracker': hasattr(mlb_system, 'enhanced_tracker'),
-            'enhanced_tracker_not_none': hasattr(mlb_system, 'enhanced_tracker') and mlb_system.enhanced_tracker is not None,
-            'tracker_thread_alive': mlb_system.tracker_thread.is_alive() if mlb_system.tracker_thread else False,
-            'keep_alive_active': mlb_system.keep_alive,
-            'ping_thread_alive': mlb_system.ping_thread.is_alive() if mlb_system.ping_thread else False,
-            'render_external_url': os.getenv('RENDER_EXTERNAL_URL', 'Not set'),
-            'render_service_name': os.getenv('RENDER_SERVICE_NAME', 'Not set')
-        }
-        
-        # Try to get enhanced tracker status directly
-        enhanced_status = {}
-        if hasattr(mlb_system, 'enhanced_tracker') and mlb_system.enhanced_tracker:
-            try:
-                enhanced_status = mlb_system.enhanced_tracker.get_status()
-            except Exception as e:
-                enhanced_status = {'error': str(e)}
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>System Status Debug</title>
-            <meta http-equiv="refresh" content="10">
-            <style>
-                body {{ font-family: Arial; background: #0f1419; color: white; padding: 20px; }}
-                .section {{ margin: 20px 0; padding: 15px; background: #21262d; border-radius: 8px; }}
-                .value {{ color: #28a745; }}
-                .error {{ color: #dc3545; }}
-                pre {{ background: #1a1a1a; padding: 10px; border-radius: 5px; overflow-x: auto; }}
-            </style>
-        </head>
-        <body>
-            <h1>🔍 System Status Debug</h1>
-            
-            <div class="section">
-                <h3>System Status:</h3>
-                <pre>{json.dumps(status, indent=2, default=str)}</pre>
-            </div>
-            
-            <div class="section">
-                <h3>Debug Info:</h3>
-                <pre>{json.dumps(debug_info, indent=2, default=str)}</pre>
-            </div>
-            
-            <div class="section">
-                <h3>Enhanced Tracker Status:</h3>
-                <pre>{json.dumps(enhanced_status, indent=2, default=str)}</pre>
-            </div>
-            
-            <p><a href="/" style="color: #ff6b35;">← Back to Dashboard</a></p>
-        </body>
-        </html>
-        """
-        return html
+        return _cached_page('debug_status', _render_debug_status)
         
     except Exception as e:
         return f"<h1>Debug Error</h1><pre>{str(e)}</pre>"
 
+def start_background_services():
+    """Start tracking and keep-alive (called once per gunicorn worker via gunicorn.conf.py)"""
+    mlb_system.start_system()
+
 def main():
     """Main function to start the system"""
     logger.info("🚀 Initializing MLB Impact System...")
+    port = int(os.environ.get('PORT', 5000))
+    
+    # Hand the process over to gunicorn with a single gevent worker: the tracker
+    # lives in-process, so more workers would mean duplicate trackers
+    try:
+        os.execvp('gunicorn', [
+            'gunicorn', '-k', 'gevent', '-w', '1', '--worker-connections', '100',
+            '-b', f'0.0.0.0:{port}', 'mlb_impact_system:app'
+        ])
+    except OSError as e:
+        logger.warning(f"gunicorn unavailable ({e}), falling back to threaded Werkzeug server")
     
     try:
         # Start the system automatically
-        mlb_system.start_system()
+        start_background_services()
         
         # Run Flask app
-        port = int(os.environ.get('PORT', 5000))
-        app.run(host='0.0.0.0', port=port, debug=False)
+        make_server('0.0.0.0', port, app, threaded=True).serve_forever()
         
     except KeyboardInterrupt:
         logger.info("🛑 Shutting down system...")
@@ -7,15 +7,19 @@ Monitors live games every 2 minutes and tweets high-impact plays immediately
 import os
 import sys
 import time
-import json
 import logging
 import requests
+import orjson
 import tweepy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageFont
-from flask import Flask, render_template_string
+from flask import Flask, render_template
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -28,15 +32,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Stats API field projections - only request what the tracker reads
+_SCHEDULE_FIELDS = 'dates,games,gamePk,status,statusCode,teams,home,away,team,abbreviation'
+_FEED_FIELDS = (
+    'liveData,plays,allPlays,about,atBatIndex,isComplete,inning,halfInning,leverageIndex,'
+    'homeWinExpectancy,awayWinExpectancy,startTime,result,description,event,homeScore,'
+    'awayScore,wpa,matchup,batter,pitcher,fullName'
+)
+
+# Fallback impact estimation when MLB doesn't provide WPA
+_EVENT_BASE_IMPACT = {
+    'home_run': 0.12,
+    'triple': 0.10,
+    'double': 0.08,
+    'walk_off': 0.25,
+    'walkoff': 0.25,
+    'grand_slam': 0.20,
+}
+_INNING_MULTIPLIER = {7: 1.1, 8: 1.1, 9: 1.3}  # Innings past the 9th are clamped to 9
+
+# Lowest impact is_high_impact_play can ever accept
+_MIN_MARQUEE_IMPACT = 0.25
+
+def _score(wpa: float, leverage: float, inning: int, event_norm: str) -> float:
+    """Impact score from MLB's WPA, or an estimate from event, leverage and inning"""
+    if wpa:
+        return abs(wpa)
+    base_impact = _EVENT_BASE_IMPACT.get(event_norm, 0.05)
+    return base_impact * leverage * _INNING_MULTIPLIER.get(min(inning, 9), 1.0)
+
+# Adaptive polling intervals (seconds)
+_POLL_CLUTCH = 30     # A live game is in a high-leverage 8th inning or later
+_POLL_LIVE = 120      # Games in progress
+_POLL_IDLE = 600      # Nothing in progress
+_KEEP_ALIVE_INTERVAL = 360
+
 class RealTimeImpactTracker:
     def __init__(self):
         self.api_base = "https://statsapi.mlb.com/api/v1.1"
         self.schedule_api_base = "https://statsapi.mlb.com/api/v1"  # Schedule uses v1 API
         self.twitter_api = self.setup_twitter()
-        self.posted_plays = set()  # Track already posted plays to avoid duplicates
+        # (game_id, atBatIndex) -> post time, insertion-ordered so expired/excess entries evict FIFO
+        self.posted_plays: OrderedDict[Tuple[int, int], float] = OrderedDict()
+        self.max_posted_plays = 10000
+        self.posted_play_ttl = 48 * 3600  # Well past any window where a play could resurface
         self.monitoring = False
         self.site_url = os.getenv('SITE_URL', 'http://localhost:5000')  # For keep-alive pings
         
+        # Shared HTTP session so every poll reuses pooled keep-alive connections.
+        # Accept-Encoding is left at the default, which advertises br when brotli is installed.
+        self.http = requests.Session()
+        self.http.headers.update({'Accept': 'application/json', 'User-Agent': 'MLB-Impact-Tracker/1.0'})
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        
+        # Per-game feed fetches are pure I/O wait, so fan them out each cycle
+        self._fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='impact-feed')
+        
+        # Keep-alive pings run off the monitor thread so a slow /health never delays a scan
+        self._ping_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='impact-ping')
+        
+        # Several marquee moments in one cycle are tweeted in parallel
+        self._post_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='impact-post')
+        self._post_lock = threading.Lock()
+        
+        # Conditional-GET validators for live feeds: game_id -> (etag, last_modified)
+        self._feed_cache: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        
+        # Highest completed at-bat already scored per game, so each cycle only handles new plays
+        self._last_atbat: Dict[int, int] = {}
+        
+        # Latest clutch state per game (high leverage, 8th+), kept across cycles with no new plays
+        self._clutch_games: Dict[int, bool] = {}
+        
         # Dashboard tracking
         self.last_check_time = None
         self.tweets_sent_today = 0
@@ -44,6 +115,10 @@ class RealTimeImpactTracker:
         self.total_games_checked = 0
         self.start_time = None
         
+        # Graphic fonts are loaded once; wrap_text measures on a reusable 1x1 canvas
+        self._load_fonts()
+        self._measure_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        
         # Official team hashtags mapping
         self.team_hashtags = {
             'OAK': '#Athletics',
@@ -77,6 +152,25 @@ class RealTimeImpactTracker:
             'CHC': '#BeHereForIt'
         }
         
+    def _load_fonts(self):
+        """Load graphic fonts with fallbacks"""
+        try:
+            self.title_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Bold.otf", 42)
+            self.subtitle_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Medium.otf", 28)
+            self.body_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Regular.otf", 24)
+            self.small_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Regular.otf", 20)
+        except:
+            try:
+                self.title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 42)
+                self.subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 28)
+                self.body_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
+                self.small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
+            except:
+                self.title_font = ImageFont.load_default()
+                self.subtitle_font = ImageFont.load_default()
+                self.body_font = ImageFont.load_default()
+                self.small_font = ImageFont.load_default()
+    
     def setup_twitter(self):
         """Initialize Twitter API"""
         try:
@@ -89,15 +183,19 @@ class RealTimeImpactTracker:
                 logger.error("Missing Twitter API credentials")
                 return None
                 
-            auth = tweepy.OAuthHandler(api_key, api_secret)
-            auth.set_access_token(access_token, access_token_secret)
-            
-            api = tweepy.API(auth, wait_on_rate_limit=True)
+            # v2 client - update_status is on the deprecated v1.1 endpoint
+            client = tweepy.Client(
+                consumer_key=api_key,
+                consumer_secret=api_secret,
+                access_token=access_token,
+                access_token_secret=access_token_secret,
+                wait_on_rate_limit=True
+            )
             
             # Test authentication
-            api.verify_credentials()
+            client.get_me()
             logger.info("Twitter API authenticated successfully")
-            return api
+            return client
             
         except Exception as e:
             logger.error(f"Failed to authenticate Twitter API: {e}")
@@ -111,15 +209,16 @@ class RealTimeImpactTracker:
             params = {
                 'sportId': 1,
                 'date': today,
-                'hydrate': 'linescore,decisions,team',
+                'hydrate': 'team',
+                'fields': _SCHEDULE_FIELDS,
                 'useLatestGames': 'false',
                 'language': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             live_games = []
             
             for date_data in data.get('dates', []):
@@ -137,19 +236,38 @@ class RealTimeImpactTracker:
             return []
     
     def get_game_plays(self, game_id: int) -> List[Dict]:
-        """Get all plays from a specific game with live feed data"""
+        """Get plays from a specific game's live feed that haven't been scored yet"""
         try:
             url = f"{self.api_base}/game/{game_id}/feed/live"
-            response = requests.get(url, timeout=30)
+            cached = self._feed_cache.get(game_id)
+            
+            headers = {}
+            if cached:
+                etag, last_modified = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self.http.get(url, params={'fields': _FEED_FIELDS}, headers=headers, timeout=30)
+            if response.status_code == 304 and cached:
+                return []  # Feed unchanged, so there are no new plays
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             plays = []
             
             # Get plays from live feed which includes WPA data
             live_plays = data.get('liveData', {}).get('plays', {}).get('allPlays', [])
             
-            for play in live_plays:
+            # Skip at-bats already scored; the in-progress one is revisited until it completes
+            last_seen = self._last_atbat.get(game_id, -1)
+            new_plays = [p for p in live_plays if p.get('about', {}).get('atBatIndex', 0) > last_seen]
+            completed = [p['about']['atBatIndex'] for p in new_plays if p.get('about', {}).get('isComplete')]
+            if completed:
+                self._last_atbat[game_id] = max(completed)
+            
+            for play in new_plays:
                 about = play.get('about', {})
                 result = play.get('result', {})
                 matchup = play.get('matchup', {})
@@ -161,6 +279,7 @@ class RealTimeImpactTracker:
                     'half_inning': about.get('halfInning', ''),
                     'description': result.get('description', ''),
                     'event': result.get('event', ''),
+                    'event_norm': result.get('event', '').lower().replace(' ', '_'),  # _EVENT_BASE_IMPACT key
                     'home_score': result.get('homeScore', 0),
                     'away_score': result.get('awayScore', 0),
                     'leverage_index': about.get('leverageIndex', 1.0),
@@ -174,6 +293,11 @@ class RealTimeImpactTracker:
                 }
                 plays.append(play_data)
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._feed_cache[game_id] = (etag, last_modified)
+            
             return plays
             
         except Exception as e:
@@ -183,45 +307,7 @@ class RealTimeImpactTracker:
     def calculate_impact_score(self, play: Dict) -> float:
         """Calculate impact score using MLB's WPA data when available"""
         try:
-            # Use actual MLB WPA (Win Probability Added) if available
-            wpa = play.get('wpa', 0.0)
-            if wpa != 0.0:
-                # Convert WPA to percentage impact
-                impact = abs(wpa)
-                logger.debug(f"Using MLB WPA: {wpa} -> {impact:.1%} impact")
-                return impact
-            
-            # Fallback: Calculate based on leverage and situation
-            leverage = play.get('leverage_index', 1.0)
-            inning = play.get('inning', 1)
-            event = play.get('event', '').lower()
-            
-            # Base impact estimation
-            base_impact = 0.05  # 5% base
-            
-            # Event type bonuses
-            if 'home_run' in event:
-                base_impact = 0.12
-            elif 'triple' in event:
-                base_impact = 0.10
-            elif 'double' in event:
-                base_impact = 0.08
-            elif 'walk_off' in event or 'walkoff' in event:
-                base_impact = 0.25
-            elif 'grand_slam' in event:
-                base_impact = 0.20
-            
-            # Leverage multiplier
-            impact = base_impact * leverage
-            
-            # Late game bonus
-            if inning >= 9:
-                impact *= 1.3
-            elif inning >= 7:
-                impact *= 1.1
-            
-            return round(impact, 4)
-            
+            return _score(play['wpa'], play['leverage_index'], play['inning'], play['event_norm'])
         except Exception as e:
             logger.error(f"Error calculating impact: {e}")
             return 0.0
@@ -240,7 +326,7 @@ class RealTimeImpactTracker:
             
         # TERTIARY: Walk-off situations get lower threshold
         # (These are always marquee regardless of WPA)
-        if impact_score >= 0.25 and leverage >= 2.5:  # 25%+ in very clutch moments
+        if impact_score >= _MIN_MARQUEE_IMPACT and leverage >= 2.5:  # 25%+ in very clutch moments
             return True
             
         # All other plays are filtered out - we want ONLY the biggest moments
@@ -254,23 +340,10 @@ class RealTimeImpactTracker:
             img = Image.new('RGB', (width, height), color='#0F1419')
             draw = ImageDraw.Draw(img)
             
-            # Load fonts with fallbacks
-            try:
-                title_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Bold.otf", 42)
-                subtitle_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Medium.otf", 28)
-                body_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Regular.otf", 24)
-                small_font = ImageFont.truetype("/System/Library/Fonts/SF-Pro-Display-Regular.otf", 20)
-            except:
-                try:
-                    title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 42)
-                    subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 28)
-                    body_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-                    small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-                except:
-                    title_font = ImageFont.load_default()
-                    subtitle_font = ImageFont.load_default()
-                    body_font = ImageFont.load_default()
-                    small_font = ImageFont.load_default()
+            title_font = self.title_font
+            subtitle_font = self.subtitle_font
+            body_font = self.body_font
+            small_font = self.small_font
             
             # Colors
             orange = '#FF6B35'
@@ -349,8 +422,9 @@ class RealTimeImpactTracker:
             draw.text((50, height - 60), f"Live • {timestamp}", fill=gray, font=small_font)
             
             # Save graphic
-            filename = f"impact_play_{int(time.time())}.png"
-            img.save(filename, "PNG", quality=95)
+            # JPEG is a fraction of the PNG size and Twitter recompresses uploads anyway
+            filename = f"impact_play_{int(time.time())}.jpg"
+            img.save(filename, "JPEG", quality=90, optimize=True, progressive=True, subsampling=2)
             logger.info(f"Created graphic: {filename}")
             
             return filename
@@ -367,7 +441,7 @@ class RealTimeImpactTracker:
         
         for word in words:
             test_line = current_line + (" " if current_line else "") + word
-            bbox = ImageDraw.Draw(Image.new('RGB', (1, 1))).textbbox((0, 0), test_line, font=font)
+            bbox = self._measure_draw.textbbox((0, 0), test_line, font=font)
             if bbox[2] - bbox[0] <= max_width:
                 current_line = test_line
             else:
@@ -393,25 +467,21 @@ class RealTimeImpactTracker:
             
             inning_text = f"{'T' if play.get('half_inning') == 'top' else 'B'}{play.get('inning', 1)}"
             
-            tweet = f"⭐ MARQUEE MOMENT!\n\n"
-            tweet += f"{description}\n\n"
-            tweet += f"📊 Impact: {impact_score:.1%} WP change\n"
-            tweet += f"⚾ {away_team} {play.get('away_score', 0)} - {play.get('home_score', 0)} {home_team} ({inning_text})\n\n"
-            
-            # Add official team hashtags
-            hashtags = []
-            if away_team in self.team_hashtags:
-                hashtags.append(self.team_hashtags[away_team])
-            if home_team in self.team_hashtags and home_team != away_team:
-                hashtags.append(self.team_hashtags[home_team])
-            
-            if hashtags:
-                tweet += " ".join(hashtags)
-            else:
-                # Fallback if team not found
-                tweet += "#MLB"
-            
-            return tweet
+            # Official team hashtags, falling back to #MLB if neither team is known
+            hashtags = [self.team_hashtags.get(away_team)]
+            if home_team != away_team:
+                hashtags.append(self.team_hashtags.get(home_team))
+            
+            return '\n'.join([
+                "⭐ MARQUEE MOMENT!",
+                "",
+                description,
+                "",
+                f"📊 Impact: {impact_score:.1%} WP change",
+                f"⚾ {away_team} {play.get('away_score', 0)} - {play.get('home_score', 0)} {home_team} ({inning_text})",
+                "",
+                " ".join(filter(None, hashtags)) or "#MLB",
+            ])
             
         except Exception as e:
             logger.error(f"Error formatting tweet: {e}")
@@ -424,11 +494,11 @@ class RealTimeImpactTracker:
                 logger.warning("Twitter API not available")
                 return False
             
-            # Create unique play ID to avoid duplicates
-            play_id = f"{play['game_id']}_{play['play_id']}_{play['inning']}_{play['half_inning']}"
+            # At-bat index is unique within a game, so this key identifies the play
+            play_key = (play['game_id'], play['play_id'])
             
-            if play_id in self.posted_plays:
-                logger.info(f"Play {play_id} already posted, skipping")
+            if play_key in self.posted_plays:
+                logger.info(f"Play {play_key} already posted, skipping")
                 return False
             
             # Format tweet (no graphics needed)
@@ -436,18 +506,29 @@ class RealTimeImpactTracker:
             
             # Post tweet without graphic
             try:
-                tweet = self.twitter_api.update_status(status=tweet_text)
+                tweet = self.twitter_api.create_tweet(text=tweet_text)
                 
-                self.posted_plays.add(play_id)
-                self.tweets_sent_today += 1
-                
-                # Store recent tweet details (keep last 5)
-                tweet_info = f"{datetime.now().strftime('%H:%M')} - {game_info.get('away_team', 'AWAY')} vs {game_info.get('home_team', 'HOME')} ({impact_score:.1%})"
-                self.recent_tweets.insert(0, tweet_info)
-                if len(self.recent_tweets) > 5:
-                    self.recent_tweets.pop()
+                # Plays from one cycle may be posted concurrently
+                with self._post_lock:
+                    now = time.time()
+                    self.posted_plays[play_key] = now
+                    
+                    # Maintain posted plays size and age
+                    while self.posted_plays and (
+                        len(self.posted_plays) > self.max_posted_plays
+                        or now - next(iter(self.posted_plays.values())) > self.posted_play_ttl
+                    ):
+                        self.posted_plays.popitem(last=False)
+                    
+                    self.tweets_sent_today += 1
+                    
+                    # Store recent tweet details (keep last 5)
+                    tweet_info = f"{datetime.now().strftime('%H:%M')} - {game_info.get('away_team', 'AWAY')} vs {game_info.get('home_team', 'HOME')} ({impact_score:.1%})"
+                    self.recent_tweets.insert(0, tweet_info)
+                    if len(self.recent_tweets) > 5:
+                        self.recent_tweets.pop()
                 
-                logger.info(f"✅ Posted marquee moment tweet: {tweet.id}")
+                logger.info(f"✅ Posted marquee moment tweet: {tweet.data['id']}")
                 
                 return True
                 
@@ -478,11 +559,11 @@ class RealTimeImpactTracker:
             logger.info("🔄 Daily counters reset at 9 AM - new day started")
     
     def monitor_games(self):
-        """Main monitoring loop - checks every 2 minutes"""
+        """Main monitoring loop - polls every 30s-10min depending on game activity"""
         logger.info("Starting real-time marquee moments monitoring...")
         self.monitoring = True
         self.start_time = datetime.now()
-        ping_counter = 0  # Track cycles for keep-alive pings
+        last_ping = time.time()  # Keep-alive pings are time-based since the cycle length varies
         
         while self.monitoring:
             try:
@@ -492,44 +573,78 @@ class RealTimeImpactTracker:
                 # Reset daily counters if new day
                 self.reset_daily_counters()
                 
-                # Keep-alive ping every 6 minutes (3 cycles of 2 minutes)
-                ping_counter += 1
-                if ping_counter >= 3:
-                    self.keep_alive_ping()
-                    ping_counter = 0
+                # Keep-alive ping every 6 minutes
+                if start_time - last_ping >= _KEEP_ALIVE_INTERVAL:
+                    self._ping_pool.submit(self.keep_alive_ping)
+                    last_ping = start_time
                 
                 # Get live games
                 live_games = self.get_live_games()
                 self.total_games_checked += len(live_games)
                 
+                games = []
                 for game in live_games:
                     game_id = game.get('gamePk')
                     if not game_id:
                         continue
                     
                     # Get game info
-                    game_info = {
+                    games.append({
                         'home_team': game.get('teams', {}).get('home', {}).get('team', {}).get('abbreviation', 'HOME'),
                         'away_team': game.get('teams', {}).get('away', {}).get('team', {}).get('abbreviation', 'AWAY'),
                         'status': game.get('status', {}).get('statusCode', ''),
                         'game_id': game_id
-                    }
-                    
-                    # Get plays from this game
-                    plays = self.get_game_plays(game_id)
+                    })
+                
+                # Forget cached feeds for games that have dropped off the schedule
+                live_ids = {g['game_id'] for g in games}
+                for per_game in (self._feed_cache, self._last_atbat, self._clutch_games):
+                    for stale_id in [gid for gid in per_game if gid not in live_ids]:
+                        del per_game[stale_id]
+                
+                # Fetch plays from all games concurrently, then process them in order
+                all_plays = self._fetch_pool.map(self.get_game_plays, [g['game_id'] for g in games])
+                
+                marquee = []
+                for game_info, plays in zip(games, all_plays):
+                    # The newest play reflects the game's current situation
+                    if plays:
+                        latest = plays[-1]
+                        self._clutch_games[game_info['game_id']] = (
+                            latest.get('inning', 0) >= 8 and (latest.get('leverage_index') or 0) >= 2.5
+                        )
                     
                     # Process all plays for impact
                     for play in plays:
+                        # MLB's WPA is the score when present, so most plays are ruled out here
+                        wpa = play['wpa']
+                        if wpa and abs(wpa) < _MIN_MARQUEE_IMPACT:
+                            continue
+                        
                         impact_score = self.calculate_impact_score(play)
                         
                         # Check if this is a marquee moment worth tweeting
                         if self.is_high_impact_play(impact_score, play.get('leverage_index', 1.0)):
                             logger.info(f"⭐ Marquee moment detected: {impact_score:.1%} impact")
-                            self.post_impact_play(play, game_info, impact_score)
+                            marquee.append((play, game_info, impact_score))
+                
+                # Post this cycle's marquee moments, concurrently when there are several
+                if len(marquee) > 1:
+                    list(self._post_pool.map(lambda m: self.post_impact_play(*m), marquee))
+                elif marquee:
+                    self.post_impact_play(*marquee[0])
+                
+                # Poll faster in clutch spots and back off when nothing is in progress
+                in_progress = [g['game_id'] for g in games if g['status'] == 'I']
+                if any(self._clutch_games.get(gid) for gid in in_progress):
+                    interval = _POLL_CLUTCH
+                elif in_progress:
+                    interval = _POLL_LIVE
+                else:
+                    interval = _POLL_IDLE
                 
-                # Calculate sleep time to maintain 2-minute intervals
                 elapsed = time.time() - start_time
-                sleep_time = max(0, 120 - elapsed)  # 2 minutes = 120 seconds
+                sleep_time = max(0, interval - elapsed)
                 
                 logger.info(f"Scan completed in {elapsed:.1f}s, checked {len(live_games)} games, sleeping for {sleep_time:.1f}s")
                 time.sleep(sleep_time)
@@ -544,6 +659,10 @@ class RealTimeImpactTracker:
     def stop_monitoring(self):
         """Stop the monitoring loop"""
         self.monitoring = False
+        self.http.close()
+        self._ping_pool.shutdown(wait=False)
+        # Fresh (idle) pool so a later restart can still ping
+        self._ping_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='impact-ping')
         logger.info("Stopping monitoring...")
     
     def keep_alive_ping(self):
@@ -551,7 +670,7 @@ class RealTimeImpactTracker:
         try:
             # Only ping if we're in production (not localhost)
             if 'localhost' not in self.site_url and '127.0.0.1' not in self.site_url:
-                response = requests.get(f"{self.site_url}/health", timeout=10)
+                response = self.http.get(f"{self.site_url}/health", timeout=10)
                 if response.status_code == 200:
                     logger.debug("Keep-alive ping successful")
                 else:
@@ -564,106 +683,36 @@ class RealTimeImpactTracker:
 app = Flask(__name__)
 tracker = RealTimeImpactTracker()
 
+# Dashboard snapshot is rebuilt at most every STATUS_CACHE_TTL seconds
+STATUS_CACHE_TTL = 2.0
+_status_cache = {'ts': 0.0, 'status': None}
+_status_lock = threading.Lock()
+
+def _status_snapshot():
+    """Dashboard status, read from the tracker at most once per STATUS_CACHE_TTL seconds"""
+    with _status_lock:
+        now = time.monotonic()
+        if _status_cache['status'] is not None and now - _status_cache['ts'] < STATUS_CACHE_TTL:
+            return _status_cache['status']
+        status = {
+            'monitoring': tracker.monitoring,
+            'posted_plays': len(tracker.posted_plays),
+            'twitter_connected': tracker.twitter_api is not None,
+            'last_check_time': tracker.last_check_time.strftime('%Y-%m-%d %H:%M:%S ET') if tracker.last_check_time else 'Never',
+            'tweets_sent_today': tracker.tweets_sent_today,
+            'recent_tweets': list(tracker.recent_tweets),
+            'total_games_checked': tracker.total_games_checked,
+            'start_time': tracker.start_time.strftime('%Y-%m-%d %H:%M:%S ET') if tracker.start_time else 'Not started',
+            'uptime': str(datetime.now() - tracker.start_time).split('.')[0] if tracker.start_time else 'Not started',
+            'next_reset': 'Tomorrow at 9:00 AM ET' if datetime.now().hour >= 9 else 'Today at 9:00 AM ET'
+        }
+        _status_cache.update(ts=now, status=status)
+        return status
+
 @app.route('/')
 def dashboard():
     """Simple dashboard showing system status"""
-    status = {
-        'monitoring': tracker.monitoring,
-        'posted_plays': len(tracker.posted_plays),
-        'twitter_connected': tracker.twitter_api is not None,
-        'last_check_time': tracker.last_check_time.strftime('%Y-%m-%d %H:%M:%S ET') if tracker.last_check_time else 'Never',
-        'tweets_sent_today': tracker.tweets_sent_today,
-        'recent_tweets': tracker.recent_tweets,
-        'total_games_checked': tracker.total_games_checked,
-        'start_time': tracker.start_time.strftime('%Y-%m-%d %H:%M:%S ET') if tracker.start_time else 'Not started',
-        'uptime': str(datetime.now() - tracker.start_time).split('.')[0] if tracker.start_time else 'Not started',
-        'next_reset': 'Tomorrow at 9:00 AM ET' if datetime.now().hour >= 9 else 'Today at 9:00 AM ET'
-    }
-    
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>MLB Impact Plays Tracker</title>
-        <meta http-equiv="refresh" content="30">
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; background: #0f1419; color: white; }
-            .header { color: #ff6b35; margin-bottom: 30px; }
-            .status { background: #21262d; padding: 20px; border-radius: 8px; margin: 20px 0; }
-            .metric { margin: 10px 0; }
-            .connected { color: #28a745; }
-            .disconnected { color: #dc3545; }
-            .monitoring { color: #ff6b35; }
-        </style>
-    </head>
-    <body>
-        <h1 class="header">⭐ MLB Marquee Moments Tracker</h1>
-        
-        <div class="status">
-            <h2>System Status</h2>
-            <div class="metric">
-                <strong>Monitoring:</strong> 
-                <span class="{{ 'monitoring' if status.monitoring else 'disconnected' }}">
-                    {{ '🟢 ACTIVE' if status.monitoring else '🔴 INACTIVE' }}
-                </span>
-            </div>
-            <div class="metric">
-                <strong>Twitter API:</strong>
-                <span class="{{ 'connected' if status.twitter_connected else 'disconnected' }}">
-                    {{ '🟢 CONNECTED' if status.twitter_connected else '🔴 DISCONNECTED' }}
-                </span>
-            </div>
-            <div class="metric">
-                <strong>Plays Posted Today:</strong> {{ status.posted_plays }}
-            </div>
-            <div class="metric">
-                <strong>Last Check:</strong> {{ status.last_check_time }}
-            </div>
-            <div class="metric">
-                <strong>Tweets Sent Today:</strong> 
-                <span class="{{ 'monitoring' if status.tweets_sent_today > 0 else 'disconnected' }}">
-                    {{ status.tweets_sent_today }}
-                </span>
-            </div>
-            <div class="metric">
-                <strong>Total Games Checked:</strong> {{ status.total_games_checked }}
-            </div>
-            <div class="metric">
-                <strong>Start Time:</strong> {{ status.start_time }}
-            </div>
-            <div class="metric">
-                <strong>Uptime:</strong> {{ status.uptime }}
-            </div>
-            <div class="metric">
-                <strong>Next Reset:</strong> {{ status.next_reset }}
-            </div>
-        </div>
-        
-        <div class="status">
-            <h3>Recent Marquee Moments</h3>
-            {% if status.recent_tweets %}
-                {% for tweet in status.recent_tweets %}
-                <div class="metric">• {{ tweet }}</div>
-                {% endfor %}
-            {% else %}
-                <div class="metric">No marquee moments detected yet today</div>
-            {% endif %}
-        </div>
-        
-        <div class="status">
-            <h3>How It Works</h3>
-            <p>• Monitors all live MLB games every 2 minutes</p>
-            <p>• Calculates win probability impact for each play</p>
-            <p>• Tweets MARQUEE MOMENTS (≥40% WP change) immediately when they occur</p>
-            <p>• NO scheduled tweets - only real-time detection and instant posting</p>
-            <p>• Daily counters reset at 9:00 AM ET (after all games finish)</p>
-            <p>• Targets 2-3 elite plays per night across MLB</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    return render_template_string(html, status=status)
+    return render_template('realtime_dashboard.html', status=_status_snapshot())
 
 @app.route('/start')
 def start_monitoring():
@@ -671,6 +720,7 @@ def start_monitoring():
     if not tracker.monitoring:
         monitoring_thread = threading.Thread(target=tracker.monitor_games, daemon=True)
         monitoring_thread.start()
+        _status_cache['ts'] = 0.0
         return "✅ Monitoring started!"
     return "⚠️ Already monitoring"
 
@@ -678,17 +728,27 @@ def start_monitoring():
 def stop_monitoring():
     """Stop monitoring endpoint"""
     tracker.stop_monitoring()
+    _status_cache['ts'] = 0.0
     return "🛑 Monitoring stopped"
 
+# Serialized /health body, reused while the second and reported flags are unchanged
+_health_cache = (None, b'')
+
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return {
-        'status': 'healthy',
-        'monitoring': tracker.monitoring,
-        'twitter_api': tracker.twitter_api is not None,
-        'timestamp': datetime.now().isoformat()
-    }
+    global _health_cache
+    key = (int(time.time()), tracker.monitoring, tracker.twitter_api is not None)
+    cached_key, body = _health_cache
+    if cached_key != key:
+        body = orjson.dumps({
+            'status': 'healthy',
+            'monitoring': key[1],
+            'twitter_api': key[2],
+            'timestamp': datetime.now().isoformat()
+        })
+        _health_cache = (key, body)
+    return app.response_class(body, mimetype='application/json')
 
 def main():
     """Main function to start the tracker"""
@@ -5,161 +5,289 @@ Shows results on a web page - safe for deployment
 """
 
 import os
-import json
+import hashlib
+import random
+import orjson
 import threading
 import time
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, request, make_response
+from werkzeug.middleware.profiler import ProfilerMiddleware
 from test_gif_with_real_games import GIFTestRunner
 
 app = Flask(__name__)
 
+class SamplingProfilerMiddleware:
+    """Profile only a random sample of requests, so profiling doesn't slow every request"""
+    def __init__(self, wsgi_app, rate):
+        self.wsgi_app = wsgi_app
+        self.rate = rate
+        self.profiled_app = ProfilerMiddleware(wsgi_app)
+    
+    def __call__(self, environ, start_response):
+        if random.random() < self.rate:
+            return self.profiled_app(environ, start_response)
+        return self.wsgi_app(environ, start_response)
+
+# Off unless PROFILE_SAMPLE_RATE is set, e.g. 0.01 to profile 1% of requests
+_profile_rate = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+if _profile_rate > 0:
+    app.wsgi_app = SamplingProfilerMiddleware(app.wsgi_app, _profile_rate)
+
+# Only the most recent results are kept, so render and JSON cost stay bounded
+MAX_TEST_RESULTS = 200
+
+# Last completed run, reloaded on start so a redeploy doesn't have to re-run the tests
+RESULTS_FILE = "gif_test_results.json"
+
 class RenderGIFTestApp:
     def __init__(self):
         self.test_runner = GIFTestRunner()
         self.test_status = "Not Started"
         self.test_results = []
         self.last_test_time = None
+        self.total_tests = 0
+        self.successful_gifs = 0  # Counted once per run rather than on every request
+        self._lock = threading.Lock()  # Published together so readers never see a half-updated run
         
+        self.load_results()
+    
+    def load_results(self):
+        """Restore the last completed run from disk"""
+        try:
+            if os.path.exists(RESULTS_FILE):
+                with open(RESULTS_FILE, 'rb') as f:
+                    data = orjson.loads(f.read())
+                results = data.get('results', [])[-MAX_TEST_RESULTS:]
+                with self._lock:
+                    self.test_results = results
+                    self.total_tests = len(results)
+                    self.successful_gifs = sum(1 for r in results if r.get('gif_created', False))
+                    self.test_status = data.get('status', self.test_status)
+                    if data.get('last_test_time'):
+                        self.last_test_time = datetime.fromisoformat(data['last_test_time'])
+                print(f"📂 Loaded {len(results)} saved test results")
+        except Exception as e:
+            print(f"⚠️ Could not load saved test results: {e}")
+    
+    def save_results(self):
+        """Write the last completed run to disk"""
+        try:
+            with self._lock:
+                data = {
+                    'results': self.test_results,
+                    'status': self.test_status,
+                    'last_test_time': self.last_test_time
+                }
+            tmp_file = RESULTS_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(data, default=str))
+            os.replace(tmp_file, RESULTS_FILE)
+        except Exception as e:
+            print(f"⚠️ Could not save test results: {e}")
+    
     def run_tests_background(self):
         """Run GIF tests in background thread"""
         try:
-            self.test_status = "Running Tests..."
+            with self._lock:
+                self.test_status = "Running Tests..."
             self.test_runner.run_comprehensive_test()
-            self.test_results = self.test_runner.test_results
-            self.test_status = "Tests Completed"
-            self.last_test_time = datetime.now()
+            results = list(self.test_runner.test_results[-MAX_TEST_RESULTS:])
+            successful_gifs = sum(1 for r in results if r.get('gif_created', False))
+            with self._lock:
+                self.test_results = results
+                self.total_tests = len(results)
+                self.successful_gifs = successful_gifs
+                self.test_status = "Tests Completed"
+                self.last_test_time = datetime.now()
+            self.save_results()
         except Exception as e:
-            self.test_status = f"Test Failed: {str(e)}"
+            with self._lock:
+                self.test_status = f"Test Failed: {str(e)}"
+    
+    def snapshot(self):
+        """Consistent (status, results, last_test_time, total_tests, successful_gifs) view of the latest run"""
+        with self._lock:
+            return self.test_status, self.test_results, self.last_test_time, self.total_tests, self.successful_gifs
 
 # Global test app instance
 gif_app = RenderGIFTestApp()
 
-@app.route('/')
-def dashboard():
-    """Main dashboard showing GIF test results"""
-    
-    # Count successful tests
-    successful_gifs = sum(1 for r in gif_app.test_results if r.get('gif_created', False))
-    total_tests = len(gif_app.test_results)
-    
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>MLB GIF Integration Test - Render Deployment</title>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
-            .container { max-width: 1200px; margin: 0 auto; }
-            .header { background: #1f2937; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-            .status-card { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-            .success { color: #10b981; }
-            .error { color: #ef4444; }
-            .warning { color: #f59e0b; }
-            .test-result { background: #f9fafb; border: 1px solid #e5e7eb; border-radius: 6px; padding: 15px; margin: 10px 0; }
-            .btn { background: #3b82f6; color: white; padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; text-decoration: none; display: inline-block; }
-            .btn:hover { background: #2563eb; }
-            .timestamp { color: #6b7280; font-size: 0.9em; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🎾 MLB GIF Integration Test</h1>
-                <p>Baseball Savant GIF Testing on Render - Live Deployment</p>
-            </div>
-            
-            <div class="status-card">
-                <h2>Test Status</h2>
-                <p><strong>Status:</strong> <span class="{{ 'success' if 'Completed' in test_status else 'warning' }}">{{ test_status }}</span></p>
-                <p><strong>Total Tests:</strong> {{ total_tests }}</p>
-                <p><strong>Successful GIFs:</strong> {{ successful_gifs }}</p>
-                {% if last_test_time %}
-                <p><strong>Last Test:</strong> <span class="timestamp">{{ last_test_time.strftime('%Y-%m-%d %H:%M:%S UTC') }}</span></p>
-                {% endif %}
-                
-                <a href="/run_test" class="btn">Run New Test</a>
-                <a href="/api/results" class="btn">View JSON Results</a>
-            </div>
-            
-            {% if test_results %}
-            <div class="status-card">
-                <h2>Test Results</h2>
-                {% for result in test_results %}
-                <div class="test-result">
-                    <h3>Game {{ result.game_id }} - Play {{ result.play_id }}</h3>
-                    <p><strong>Event:</strong> {{ result.event }}</p>
-                    <p><strong>Description:</strong> {{ result.description }}</p>
-                    <p><strong>Statcast Data:</strong> 
-                        <span class="{{ 'success' if result.statcast_found else 'error' }}">
-                            {{ '✅ Found' if result.statcast_found else '❌ Not Found' }}
-                        </span>
-                    </p>
-                    <p><strong>GIF Created:</strong> 
-                        <span class="{{ 'success' if result.gif_created else 'error' }}">
-                            {{ '✅ Success' if result.gif_created else '❌ Failed' }}
-                        </span>
-                    </p>
-                    {% if result.gif_path %}
-                    <p><strong>GIF Path:</strong> {{ result.gif_path }}</p>
-                    {% endif %}
-                    {% if result.error %}
-                    <p><strong>Error:</strong> <span class="error">{{ result.error }}</span></p>
-                    {% endif %}
-                    <p class="timestamp">{{ result.timestamp }}</p>
-                </div>
-                {% endfor %}
-            </div>
+# Test runs go through one worker; the in-flight flag rejects overlapping requests
+_test_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gif-test')
+_test_inflight = threading.Event()
+_test_start_lock = threading.Lock()
+
+def _run_tests_and_clear():
+    """Run the test suite, then allow the next run to start"""
+    try:
+        gif_app.run_tests_background()
+    finally:
+        _test_inflight.clear()
+
+def start_test_run():
+    """Submit a background test run unless one is already in flight"""
+    with _test_start_lock:
+        if _test_inflight.is_set():
+            return False
+        _test_inflight.set()
+    _test_executor.submit(_run_tests_and_clear)
+    return True
+
+_DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>MLB GIF Integration Test - Render Deployment</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { background: #1f2937; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .status-card { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .success { color: #10b981; }
+        .error { color: #ef4444; }
+        .warning { color: #f59e0b; }
+        .test-result { background: #f9fafb; border: 1px solid #e5e7eb; border-radius: 6px; padding: 15px; margin: 10px 0; }
+        .btn { background: #3b82f6; color: white; padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; text-decoration: none; display: inline-block; }
+        .btn:hover { background: #2563eb; }
+        .timestamp { color: #6b7280; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎾 MLB GIF Integration Test</h1>
+            <p>Baseball Savant GIF Testing on Render - Live Deployment</p>
+        </div>
+        
+        <div class="status-card">
+            <h2>Test Status</h2>
+            <p><strong>Status:</strong> <span class="{{ 'success' if 'Completed' in test_status else 'warning' }}">{{ test_status }}</span></p>
+            <p><strong>Total Tests:</strong> {{ total_tests }}</p>
+            <p><strong>Successful GIFs:</strong> {{ successful_gifs }}</p>
+            {% if last_test_time %}
+            <p><strong>Last Test:</strong> <span class="timestamp">{{ last_test_time.strftime('%Y-%m-%d %H:%M:%S UTC') }}</span></p>
             {% endif %}
             
-            <div class="status-card">
-                <h2>How It Works</h2>
-                <ul>
-                    <li>🔍 Fetches today's MLB games from MLB API</li>
-                    <li>🎮 Analyzes recent plays for GIF-worthy content</li>
-                    <li>📊 Checks Baseball Savant for Statcast data</li>
-                    <li>🎬 Downloads animations and converts to GIF</li>
-                    <li>✅ Reports success/failure for each play</li>
-                </ul>
-                
-                <h3>Next Steps (When Games Are Live):</h3>
-                <ul>
-                    <li>🔥 High-impact plays will generate GIFs automatically</li>
-                    <li>🐦 Integration with Twitter posting (when enabled)</li>
-                    <li>⚡ Real-time monitoring during games</li>
-                </ul>
+            <a href="/run_test" class="btn">Run New Test</a>
+            <a href="/api/results" class="btn">View JSON Results</a>
+        </div>
+        
+        {% if test_results %}
+        <div class="status-card">
+            <h2>Test Results</h2>
+            {% for result in test_results %}
+            <div class="test-result">
+                <h3>Game {{ result.game_id }} - Play {{ result.play_id }}</h3>
+                <p><strong>Event:</strong> {{ result.event }}</p>
+                <p><strong>Description:</strong> {{ result.description }}</p>
+                <p><strong>Statcast Data:</strong> 
+                    <span class="{{ 'success' if result.statcast_found else 'error' }}">
+                        {{ '✅ Found' if result.statcast_found else '❌ Not Found' }}
+                    </span>
+                </p>
+                <p><strong>GIF Created:</strong> 
+                    <span class="{{ 'success' if result.gif_created else 'error' }}">
+                        {{ '✅ Success' if result.gif_created else '❌ Failed' }}
+                    </span>
+                </p>
+                {% if result.gif_path %}
+                <p><strong>GIF Path:</strong> {{ result.gif_path }}</p>
+                {% endif %}
+                {% if result.error %}
+                <p><strong>Error:</strong> <span class="error">{{ result.error }}</span></p>
+                {% endif %}
+                <p class="timestamp">{{ result.timestamp }}</p>
             </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+        
+        <div class="status-card">
+            <h2>How It Works</h2>
+            <ul>
+                <li>🔍 Fetches today's MLB games from MLB API</li>
+                <li>🎮 Analyzes recent plays for GIF-worthy content</li>
+                <li>📊 Checks Baseball Savant for Statcast data</li>
+                <li>🎬 Downloads animations and converts to GIF</li>
+                <li>✅ Reports success/failure for each play</li>
+            </ul>
             
-            <div class="status-card">
-                <h2>Technical Info</h2>
-                <p><strong>Environment:</strong> Render Deployment</p>
-                <p><strong>Time Zone:</strong> UTC</p>
-                <p><strong>Python Version:</strong> 3.9</p>
-                <p><strong>Dependencies:</strong> ffmpeg, requests, flask, ffmpeg-python</p>
-                <p><strong>Repository:</strong> <a href="https://github.com/JRossell27/Impact-plays-Visual-TEST.git" target="_blank">GitHub</a></p>
-            </div>
+            <h3>Next Steps (When Games Are Live):</h3>
+            <ul>
+                <li>🔥 High-impact plays will generate GIFs automatically</li>
+                <li>🐦 Integration with Twitter posting (when enabled)</li>
+                <li>⚡ Real-time monitoring during games</li>
+            </ul>
+        </div>
+        
+        <div class="status-card">
+            <h2>Technical Info</h2>
+            <p><strong>Environment:</strong> Render Deployment</p>
+            <p><strong>Time Zone:</strong> UTC</p>
+            <p><strong>Python Version:</strong> 3.9</p>
+            <p><strong>Dependencies:</strong> ffmpeg, requests, flask, ffmpeg-python</p>
+            <p><strong>Results Kept:</strong> most recent {{ max_results }}</p>
+            <p><strong>Repository:</strong> <a href="https://github.com/JRossell27/Impact-plays-Visual-TEST.git" target="_blank">GitHub</a></p>
         </div>
-    </body>
-    </html>
-    """
+    </div>
+</body>
+</html>
+"""
+
+# Compiled once; Flask's environment keeps autoescaping on for string templates
+_DASHBOARD_TEMPLATE = app.jinja_env.from_string(_DASHBOARD_HTML)
+
+def _results_etag(status, last_test_time, total_tests):
+    """ETag for a test state snapshot - results only change when a run finishes"""
+    state = f"{last_test_time}-{total_tests}-{status}"
+    return hashlib.md5(state.encode()).hexdigest()
+
+# Last rendered dashboard as UTF-8 bytes, keyed on the same state as the ETag
+_dashboard_cache = {'key': None, 'body': None}
+_dashboard_lock = threading.Lock()
+
+def _json(obj):
+    """JSON response encoded with orjson (datetimes serialize natively, anything else via str)"""
+    return Response(orjson.dumps(obj, default=str), mimetype='application/json')
+
+def _tagged(body, etag):
+    """Response carrying etag, turned into a 304 if the client already has this version"""
+    response = make_response(body)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@app.route('/')
+def dashboard():
+    """Main dashboard showing GIF test results"""
+    status, results, last_test_time, total_tests, successful_gifs = gif_app.snapshot()
+    etag = _results_etag(status, last_test_time, total_tests)
+    if etag in request.if_none_match:
+        return _tagged('', etag)  # Unchanged - skip rendering entirely
+    
+    with _dashboard_lock:
+        if _dashboard_cache['key'] != etag:
+            _dashboard_cache['body'] = _DASHBOARD_TEMPLATE.render(
+                test_status=status,
+                test_results=results,
+                total_tests=total_tests,
+                successful_gifs=successful_gifs,
+                last_test_time=last_test_time,
+                max_results=MAX_TEST_RESULTS
+            ).encode('utf-8')
+            _dashboard_cache['key'] = etag
+        body = _dashboard_cache['body']
     
-    return render_template_string(html_template, 
-                                test_status=gif_app.test_status,
-                                test_results=gif_app.test_results,
-                                total_tests=total_tests,
-                                successful_gifs=successful_gifs,
-                                last_test_time=gif_app.last_test_time)
+    # Responses are mutated per request (ETag, 304), so only the bytes are shared
+    return _tagged(body, etag)
 
 @app.route('/run_test')
 def run_test():
     """Start a new test run"""
-    if gif_app.test_status != "Running Tests...":
-        # Start tests in background thread
-        test_thread = threading.Thread(target=gif_app.run_tests_background)
-        test_thread.daemon = True
-        test_thread.start()
+    if start_test_run():
         return "Test started! <a href='/'>Return to dashboard</a>"
     else:
         return "Test already running! <a href='/'>Return to dashboard</a>"
@@ -167,18 +295,37 @@ def run_test():
 @app.route('/api/results')
 def api_results():
     """Return test results as JSON"""
-    return jsonify({
-        'status': gif_app.test_status,
-        'total_tests': len(gif_app.test_results),
-        'successful_gifs': sum(1 for r in gif_app.test_results if r.get('gif_created', False)),
-        'last_test_time': gif_app.last_test_time.isoformat() if gif_app.last_test_time else None,
-        'results': gif_app.test_results
-    })
+    status, results, last_test_time, total_tests, successful_gifs = gif_app.snapshot()
+    etag = _results_etag(status, last_test_time, total_tests)
+    if etag in request.if_none_match:
+        return _tagged('', etag)  # Unchanged - skip rendering entirely
+    
+    return _tagged(_json({
+        'status': status,
+        'total_tests': total_tests,
+        'successful_gifs': successful_gifs,
+        'last_test_time': last_test_time.isoformat() if last_test_time else None,
+        'results': results
+    }), etag)
+
+# Serialized /health body, re-encoded at most once per second
+_health_cache = (0, b'')  # (second, body), swapped as one tuple
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    global _health_cache
+    sec = int(time.time())
+    cached_sec, body = _health_cache
+    if cached_sec != sec:
+        body = orjson.dumps({'status': 'healthy', 'timestamp': datetime.now()})
+        _health_cache = (sec, body)
+    return Response(body, mimetype='application/json')
+
+def start_background_services():
+    """Auto-start the first test run unless saved results were loaded (called once per gunicorn worker via gunicorn.conf.py)"""
+    if gif_app.last_test_time is None:
+        start_test_run()
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
@@ -187,9 +334,17 @@ if __name__ == '__main__':
     print("🚀 Starting MLB GIF Integration Test on Render")
     print(f"🌐 Web interface will be available on port {port}")
     
+    # Hand the process over to gunicorn with a single gevent worker: test state
+    # lives in-process, so more workers would each show different results
+    try:
+        os.execvp('gunicorn', [
+            'gunicorn', '-k', 'gevent', '-w', '1', '--worker-connections', '100',
+            '-b', f'0.0.0.0:{port}', 'render_gif_web_test:app'
+        ])
+    except OSError as e:
+        print(f"⚠️ gunicorn unavailable ({e}), falling back to threaded Werkzeug server")
+    
     # Start initial test in background
-    initial_test_thread = threading.Thread(target=gif_app.run_tests_background)
-    initial_test_thread.daemon = True
-    initial_test_thread.start()
+    start_background_services()
     
-    app.run(host='0.0.0.0', port=port, debug=False) 
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True) 
\ No newline at end of file
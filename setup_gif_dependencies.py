@@ -8,11 +8,19 @@ import subprocess
 import sys
 import platform
 import os
+import shutil
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def check_ffmpeg():
-    """Check if ffmpeg is installed"""
+    """Check if ffmpeg is installed (cached; cleared after an install)"""
+    # PATH lookup first - no need to spawn ffmpeg if it isn't there
+    ffmpeg_path = shutil.which('ffmpeg')
+    if ffmpeg_path is None:
+        return False
     try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, timeout=5)
+        # Exec the resolved path so the PATH isn't searched a second time
+        result = subprocess.run([ffmpeg_path, '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
         return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
@@ -104,6 +112,7 @@ def main():
         if not install_ffmpeg():
             print("\n❌ Setup failed. Please install ffmpeg manually.")
             return False
+        check_ffmpeg.cache_clear()
     
     # Test everything
     if test_installation():
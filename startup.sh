@@ -22,5 +22,6 @@ print('✅ Enhanced Impact Tracker test completed')
 "
 else
     echo "⚾🎯 Running Enhanced MLB Impact Tracker with GIF integration..."
-    python enhanced_dashboard.py
+    # Single gevent worker: the tracker runs in-process, so more workers would duplicate it
+    exec gunicorn -k gevent -w 1 --worker-connections 100 -b "0.0.0.0:${PORT:-5000}" enhanced_dashboard:app
 fi 
\ No newline at end of file
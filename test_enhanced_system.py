@@ -75,14 +75,18 @@ def test_queue_system():
     tracker.processed_plays.add(mock_play.play_id)
     tracker.plays_queued_today += 1
     
-    logger.info(f"✅ Queued play: {mock_play.event} - {mock_play.impact_score:.1%} impact")
-    logger.info(f"   Teams: {mock_play.away_team} @ {mock_play.home_team}")
-    logger.info(f"   Queue size: {len(tracker.play_queue)}")
+    logger.info("\n".join([
+        f"✅ Queued play: {mock_play.event} - {mock_play.impact_score:.1%} impact",
+        f"   Teams: {mock_play.away_team} @ {mock_play.home_team}",
+        f"   Queue size: {len(tracker.play_queue)}",
+    ]))
     
     # Test 2: Attempt GIF creation
     logger.info("\n🎬 TEST 2: GIF Creation Process")
     
-    for attempt in range(1, 4):  # Try 3 attempts
+    gif_ready = False
+    max_attempts = 3
+    for attempt in range(1, max_attempts + 1):
         logger.info(f"\n   Attempt {attempt}/5 to create GIF...")
         mock_play.gif_attempts = attempt
         mock_play.last_attempt = datetime.now()
@@ -102,14 +106,16 @@ def test_queue_system():
                 tracker.gifs_created_today += 1
                 
                 logger.info(f"   ✅ SUCCESS! GIF created: {gif_path}")
-                break
+                gif_ready = True
             else:
                 logger.info(f"   ⏳ GIF not yet available (attempt {attempt})")
                 
         except Exception as e:
             logger.info(f"   ❌ Error on attempt {attempt}: {str(e)[:100]}...")
         
-        # Wait a bit between attempts (simulate real timing)
+        # Stop as soon as the GIF is ready; otherwise wait a bit between attempts (simulate real timing)
+        if gif_ready or attempt == max_attempts:
+            break
         time.sleep(2)
     
     # Test 3: Tweet formatting and posting simulation
@@ -117,17 +123,20 @@ def test_queue_system():
     
     if mock_play.gif_created:
         tweet_text = tracker.format_complete_tweet_text(mock_play)
-        logger.info(f"✅ Tweet formatted successfully:")
-        logger.info(f"   Length: {len(tweet_text)} characters")
-        logger.info(f"   Preview:")
-        for i, line in enumerate(tweet_text.split('\n')[:5]):
-            logger.info(f"     {line}")
-        if len(tweet_text.split('\n')) > 5:
-            logger.info("     ...")
+        tweet_lines = tweet_text.split('\n')
+        msgs = [
+            "✅ Tweet formatted successfully:",
+            f"   Length: {len(tweet_text)} characters",
+            "   Preview:",
+        ]
+        msgs.extend(f"     {line}" for line in tweet_lines[:5])
+        if len(tweet_lines) > 5:
+            msgs.append("     ...")
         
         # Simulate posting (don't actually post to Twitter in test)
-        logger.info(f"\n📤 Simulating Twitter post...")
-        logger.info(f"   ✅ Would post tweet with GIF: {mock_play.gif_path}")
+        msgs.append("\n📤 Simulating Twitter post...")
+        msgs.append(f"   ✅ Would post tweet with GIF: {mock_play.gif_path}")
+        logger.info("\n".join(msgs))
         mock_play.tweet_posted = True
         tracker.tweets_posted_today += 1
         
@@ -135,19 +144,22 @@ def test_queue_system():
         logger.info("❌ No GIF available, cannot post complete tweet")
     
     # Test 4: System status
-    logger.info("\n📊 TEST 4: System Status")
     status = tracker.get_status()
     
-    logger.info(f"   Plays queued today: {status['plays_queued_today']}")
-    logger.info(f"   GIFs created today: {status['gifs_created_today']}")
-    logger.info(f"   Tweets posted today: {status['tweets_posted_today']}")
-    logger.info(f"   Current queue size: {status['current_queue_size']}")
+    msgs = [
+        "\n📊 TEST 4: System Status",
+        f"   Plays queued today: {status['plays_queued_today']}",
+        f"   GIFs created today: {status['gifs_created_today']}",
+        f"   Tweets posted today: {status['tweets_posted_today']}",
+        f"   Current queue size: {status['current_queue_size']}",
+    ]
     
     if status['queue_details']:
-        logger.info(f"\n   Queue details:")
+        msgs.append("\n   Queue details:")
         for i, play in enumerate(status['queue_details'], 1):
-            logger.info(f"     #{i}: {play['event']} - {play['impact']} impact")
-            logger.info(f"         Status: {'✅ Posted' if play['tweet_posted'] else '🎬 Processing'}")
+            msgs.append(f"     #{i}: {play['event']} - {play['impact']} impact")
+            msgs.append(f"         Status: {'✅ Posted' if play['tweet_posted'] else '🎬 Processing'}")
+    logger.info("\n".join(msgs))
     
     # Clean up
     logger.info("\n🧹 Cleanup")
@@ -163,19 +175,18 @@ def test_queue_system():
     tracker.save_queue()
     logger.info(f"   ✅ Saved queue state")
     
-    logger.info("\n" + "=" * 60)
-    logger.info("🎉 Enhanced Impact Tracker Test Complete!")
-    logger.info("   The system successfully demonstrated:")
-    logger.info("   ✅ High-impact play queueing")
-    logger.info("   ✅ GIF creation workflow")  
-    logger.info("   ✅ Complete tweet formatting")
-    logger.info("   ✅ Queue management and persistence")
+    logger.info("\n".join([
+        "\n" + "=" * 60,
+        "🎉 Enhanced Impact Tracker Test Complete!",
+        "   The system successfully demonstrated:",
+        "   ✅ High-impact play queueing",
+        "   ✅ GIF creation workflow",
+        "   ✅ Complete tweet formatting",
+        "   ✅ Queue management and persistence",
+    ]))
 
 def test_workflow_overview():
     """Display an overview of the enhanced workflow"""
-    logger.info("\n🔄 ENHANCED WORKFLOW OVERVIEW")
-    logger.info("=" * 60)
-    
     workflow_steps = [
         "1. 🔍 Monitor live games every 2 minutes",
         "2. 📊 Calculate WPA impact for each play",
@@ -188,10 +199,6 @@ def test_workflow_overview():
         "9. 📈 Track daily statistics and system health"
     ]
     
-    for step in workflow_steps:
-        logger.info(f"   {step}")
-    
-    logger.info("\n🔥 KEY IMPROVEMENTS:")
     improvements = [
         "• No more separate 'follow-up' tweets",
         "• Complete impact + GIF posts for maximum engagement",
@@ -201,8 +208,11 @@ def test_workflow_overview():
         "• Persistent storage prevents data loss"
     ]
     
-    for improvement in improvements:
-        logger.info(f"   {improvement}")
+    msgs = ["\n🔄 ENHANCED WORKFLOW OVERVIEW", "=" * 60]
+    msgs.extend(f"   {step}" for step in workflow_steps)
+    msgs.append("\n🔥 KEY IMPROVEMENTS:")
+    msgs.extend(f"   {improvement}" for improvement in improvements)
+    logger.info("\n".join(msgs))
 
 if __name__ == "__main__":
     logger.info("🚀 Starting Enhanced Impact Tracker Tests...")
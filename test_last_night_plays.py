@@ -5,31 +5,126 @@ Finds all plays from June 17, 2025 that meet the 40% WP threshold
 and processes them through the complete GIF creation and posting pipeline
 """
 
-import os
 import sys
 import time
-import json
+import orjson
 import logging
-import requests
+from logging.handlers import MemoryHandler
+import threading
+import diskcache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from enhanced_impact_tracker import EnhancedImpactTracker
 
-# Configure logging for test
+# Configure logging for test; the file side is buffered and flushed in batches
+_log_file = logging.FileHandler('test_last_night_plays.log')
+# Raw epoch timestamps skip a strftime per record on the chatty file side
+_log_file.setFormatter(logging.Formatter('%(created).3f - %(levelname)s - %(message)s'))
+# force: importing the tracker has already configured the root logger
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('test_last_night_plays.log'),
+        MemoryHandler(1024, flushLevel=logging.WARNING, target=_log_file),
         logging.StreamHandler(sys.stdout)
-    ]
+    ],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+# Games are independent network round-trips; fetch them side by side
+_FETCH_WORKERS = 8
+
+# Responses for finished games never change, so repeat runs read them from disk
+_HTTP_CACHE_DIR = './http_cache'
+_LIVE_CACHE_TTL = 300
+_FINAL_STATUSES = ('F', 'O')
+
+# Savant enrichment is skipped below both of these
+_SAVANT_MIN_LEVERAGE = 0.5
+_SAVANT_MIN_WPA = 0.20
+
+# Pipeline API budget: at most 30 plays processed per rolling minute
+_PLAY_RATE = 30
+_PLAY_RATE_PERIOD = 60.0
+
+# GIF creation is download/ffmpeg bound and independent per play
+_GIF_WORKERS = 4
+
+class _RateLimiter:
+    """Thread-safe token bucket that only blocks once the budget is spent"""
+    
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.refill_per_sec = rate / period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_per_sec
+            time.sleep(wait)
+
 class LastNightPlayTester:
     def __init__(self):
         self.tracker = EnhancedImpactTracker()
         self.test_date = "2025-06-17"  # Last night
         self.found_plays = []
+        self._http_cache = diskcache.Cache(_HTTP_CACHE_DIR, size_limit=200 * 1024 * 1024)
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._play_limiter = _RateLimiter(_PLAY_RATE, _PLAY_RATE_PERIOD)
+        
+    def _count_cache(self, hit: bool):
+        """Track disk cache effectiveness across fetch threads"""
+        with self._cache_lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+    
+    def _get_json(self, url: str, params: dict):
+        """GET a JSON payload, served from the disk cache when possible"""
+        key = ('json', url, tuple(sorted(params.items())))
+        data = self._http_cache.get(key)
+        self._count_cache(data is not None)
+        if data is not None:
+            return data
+        
+        response = self.tracker.session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # A schedule is final once every game on it is
+        statuses = [game.get('status', {}).get('statusCode', '')
+                    for date_data in data.get('dates', []) for game in date_data.get('games', [])]
+        final = bool(statuses) and all(status in _FINAL_STATUSES for status in statuses)
+        self._http_cache.set(key, data, expire=None if final else _LIVE_CACHE_TTL)
+        return data
+    
+    def _get_game_plays(self, game):
+        """Get a game's plays, cached permanently once the game is final"""
+        game_id = game['gamePk']
+        key = ('plays', game_id)
+        plays = self._http_cache.get(key)
+        self._count_cache(plays is not None)
+        if plays is not None:
+            return plays
+        
+        plays = self.tracker.get_game_plays(game_id)
+        if plays:
+            final = game.get('status', {}).get('statusCode', '') in _FINAL_STATUSES
+            self._http_cache.set(key, plays, expire=None if final else _LIVE_CACHE_TTL)
+        return plays
         
     def get_games_from_date(self, date_str: str):
         """Get all games from a specific date"""
@@ -43,10 +138,7 @@ class LastNightPlayTester:
                 'language': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             games = []
             
             for date_data in data.get('dates', []):
@@ -63,91 +155,128 @@ class LastNightPlayTester:
             logger.error(f"Error fetching games from {date_str}: {e}")
             return []
     
+    def _fetch_game(self, game):
+        """Fetch a game's plays and enrich them with Baseball Savant WP% data"""
+        game_id = game.get('gamePk')
+        if not game_id:
+            return game, [], 0
+        
+        plays = self._get_game_plays(game)
+        skipped = 0
+        for play in plays:
+            play['test_date'] = self.test_date
+            
+            # Low-leverage plays with a small MLB WPA can't reach the marquee thresholds
+            if (play.get('leverage_index', 1.0) < _SAVANT_MIN_LEVERAGE
+                    and abs(play.get('wpa', 0.0)) < _SAVANT_MIN_WPA):
+                skipped += 1
+                continue
+            
+            savant_data = self.tracker.get_enhanced_wp_data_from_savant(game_id, play)
+            if savant_data and 'delta_home_win_exp' in savant_data:
+                play['delta_home_win_exp'] = savant_data['delta_home_win_exp']
+        return game, plays, skipped
+    
     def find_high_impact_plays(self):
         """Find all high-impact plays from last night"""
-        logger.info(f"🔍 Searching for high-impact plays from {self.test_date}")
+        logger.info("🔍 Searching for high-impact plays from %s", self.test_date)
         
         games = self.get_games_from_date(self.test_date)
         total_plays_checked = 0
         high_impact_count = 0
+        savant_skipped = 0
+        
+        # Network work fans out across games; scoring stays serial so logs read in order
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+            fetched = list(pool.map(self._fetch_game, games))
+        
+        # Checked once: the per-play detail below is skipped outright when INFO is muted
+        log_plays = logger.isEnabledFor(logging.INFO)
         
-        for game in games:
+        for game, plays, skipped in fetched:
+            savant_skipped += skipped
             game_id = game.get('gamePk')
             if not game_id:
                 continue
                 
+            teams = game.get('teams', {})
+            home = teams.get('home', {})
+            away = teams.get('away', {})
             game_info = {
-                'home_team': game.get('teams', {}).get('home', {}).get('team', {}).get('abbreviation', 'HOME'),
-                'away_team': game.get('teams', {}).get('away', {}).get('team', {}).get('abbreviation', 'AWAY'),
+                'home_team': home.get('team', {}).get('abbreviation', 'HOME'),
+                'away_team': away.get('team', {}).get('abbreviation', 'AWAY'),
                 'status': game.get('status', {}).get('statusCode', ''),
                 'game_id': game_id,
-                'final_score': f"{game.get('teams', {}).get('away', {}).get('score', 0)}-{game.get('teams', {}).get('home', {}).get('score', 0)}"
+                'final_score': f"{away.get('score', 0)}-{home.get('score', 0)}"
             }
             
-            logger.info(f"📊 Analyzing {game_info['away_team']} @ {game_info['home_team']} (Final: {game_info['final_score']})")
+            logger.info("📊 Analyzing %s @ %s (Final: %s)",
+                        game_info['away_team'], game_info['home_team'], game_info['final_score'])
             
-            # Get all plays from this game
-            plays = self.tracker.get_game_plays(game_id)
             total_plays_checked += len(plays)
             
             for play in plays:
-                # STEP 1: Enhance play with Baseball Savant WP% data
-                play['test_date'] = self.test_date
-                savant_data = self.tracker.get_enhanced_wp_data_from_savant(game_id, play)
-                if savant_data and 'delta_home_win_exp' in savant_data:
-                    play['delta_home_win_exp'] = savant_data['delta_home_win_exp']
-                    logger.info(f"  📈 Found Baseball Savant WP%: {savant_data['delta_home_win_exp']:.1%} for {play.get('event', 'Unknown')}")
+                # STEP 1: Baseball Savant WP% data was attached during the fetch
+                if log_plays and 'delta_home_win_exp' in play:
+                    logger.info("  📈 Found Baseball Savant WP%%: %.1f%% for %s",
+                                play['delta_home_win_exp'] * 100, play.get('event', 'Unknown'))
                 
                 # STEP 2: Calculate impact score
                 impact_score = self.tracker.calculate_impact_score(play)
                 
                 # Log details about this play for debugging
-                if impact_score > 0.20:  # Log any potentially interesting plays
-                    logger.info(f"  🔍 Play analysis: {play.get('event', 'Unknown')} - {impact_score:.1%} impact")
-                    logger.info(f"     Description: {play.get('description', 'No description')}")
-                    logger.info(f"     Leverage: {play.get('leverage_index', 1.0):.2f}, Inning: {play.get('inning', 0)}{play.get('half_inning', '')}")
-                    logger.info(f"     WPA: {play.get('wpa', 'missing')}, MLB data available: {'wpa' in play}")
+                if log_plays and impact_score > 0.20:  # Log any potentially interesting plays
+                    logger.info("  🔍 Play analysis: %s - %.1f%% impact", play.get('event', 'Unknown'), impact_score * 100)
+                    logger.info("     Description: %s", play.get('description', 'No description'))
+                    logger.info("     Leverage: %.2f, Inning: %s%s",
+                                play.get('leverage_index', 1.0), play.get('inning', 0), play.get('half_inning', ''))
+                    logger.info("     WPA: %s, MLB data available: %s", play.get('wpa', 'missing'), 'wpa' in play)
                 
                 # STEP 3: Check if it meets the threshold
                 if self.tracker.is_high_impact_play(impact_score, play.get('leverage_index', 1.0)):
                     high_impact_count += 1
                     
-                    play_summary = {
-                        'game_id': game_id,
-                        'game_info': game_info,
-                        'play': play,
-                        'impact_score': impact_score,
-                        'description': play.get('description', ''),
-                        'event': play.get('event', ''),
-                        'inning': play.get('inning', 0),
-                        'half_inning': play.get('half_inning', ''),
-                        'batter': play.get('batter', ''),
-                        'leverage': play.get('leverage_index', 1.0)
-                    }
+                    # game_info is shared by every play from this game
+                    self.found_plays.append((game_info, play, impact_score))
                     
-                    self.found_plays.append(play_summary)
-                    
-                    logger.info(f"⭐ HIGH-IMPACT PLAY FOUND!")
-                    logger.info(f"   Game: {game_info['away_team']} @ {game_info['home_team']}")
-                    logger.info(f"   Play: {play.get('event', 'Unknown')} - {play.get('description', '')}")
-                    logger.info(f"   Impact: {impact_score:.1%} WP change")
-                    logger.info(f"   Inning: {play.get('half_inning', '')} {play.get('inning', 0)}")
-                    logger.info(f"   Leverage: {play.get('leverage_index', 1.0):.2f}")
+                    if log_plays:
+                        logger.info("⭐ HIGH-IMPACT PLAY FOUND!")
+                        logger.info("   Game: %s @ %s", game_info['away_team'], game_info['home_team'])
+                        logger.info("   Play: %s - %s", play.get('event', 'Unknown'), play.get('description', ''))
+                        logger.info("   Impact: %.1f%% WP change", impact_score * 100)
+                        logger.info("   Inning: %s %s", play.get('half_inning', ''), play.get('inning', 0))
+                        logger.info("   Leverage: %.2f", play.get('leverage_index', 1.0))
         
-        logger.info(f"📊 SEARCH COMPLETE:")
-        logger.info(f"   Total games checked: {len(games)}")
-        logger.info(f"   Total plays analyzed: {total_plays_checked}")
-        logger.info(f"   High-impact plays found: {high_impact_count}")
+        logger.info("📊 SEARCH COMPLETE:")
+        logger.info("   Total games checked: %d", len(games))
+        logger.info("   Total plays analyzed: %d", total_plays_checked)
+        logger.info("   Savant lookups skipped (low leverage): %d", savant_skipped)
+        logger.info("   High-impact plays found: %d", high_impact_count)
+        logger.info("   HTTP cache: %d hits, %d misses", self.cache_hits, self.cache_misses)
         
         return self.found_plays
     
+    def _create_gif(self, queued_play):
+        """Create the GIF for a queued play, returning its path or None"""
+        # Only waits if we are outpacing the GIF/Twitter budget
+        self._play_limiter.acquire()
+        
+        logger.info("   🎬 Attempting GIF creation for %s...", queued_play.event)
+        # get_gif_for_play only returns a path once the file exists
+        return self.tracker.gif_integration.get_gif_for_play(
+            game_id=queued_play.game_id,
+            play_id=queued_play.mlb_play_data.get('atBatIndex', 0),
+            game_date=queued_play.game_date,
+            mlb_play_data=queued_play.mlb_play_data
+        )
+    
     def process_found_plays(self):
         """Process each found play through the complete pipeline"""
         if not self.found_plays:
             logger.info("No high-impact plays found to process")
             return
         
-        logger.info(f"🎬 Starting end-to-end processing of {len(self.found_plays)} high-impact plays...")
+        logger.info("🎬 Starting end-to-end processing of %d high-impact plays...", len(self.found_plays))
         
         # Check Twitter connection
         if not self.tracker.twitter_api:
@@ -158,70 +287,75 @@ class LastNightPlayTester:
         successful_gifs = 0
         successful_posts = 0
         
-        for i, play_data in enumerate(self.found_plays, 1):
-            logger.info(f"\n🎯 Processing play {i}/{len(self.found_plays)}")
-            logger.info(f"   {play_data['event']} - {play_data['impact_score']:.1%} impact")
-            logger.info(f"   {play_data['game_info']['away_team']} @ {play_data['game_info']['home_team']}")
+        # Queue serially so each play's QueuedPlay can be picked off the tail
+        queued_plays = []
+        for i, (game_info, play, impact_score) in enumerate(self.found_plays, 1):
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n🎯 Queueing play %d/%d", i, len(self.found_plays))
+                logger.info("   %s - %.1f%% impact", play.get('event', ''), impact_score * 100)
+                logger.info("   %s @ %s", game_info['away_team'], game_info['home_team'])
             
             try:
                 # Queue the play using the normal system
                 queued = self.tracker.queue_high_impact_play(
-                    play_data['play'], 
-                    play_data['game_info'], 
-                    play_data['impact_score']
+                    play, 
+                    game_info, 
+                    impact_score
                 )
                 
                 if queued:
-                    logger.info(f"   ✅ Play queued successfully")
-                    
-                    # Try to create GIF immediately for testing
-                    queued_play = self.tracker.play_queue[-1]  # Get the just-added play
-                    
-                    logger.info(f"   🎬 Attempting GIF creation...")
-                    
-                    gif_path = self.tracker.gif_integration.get_gif_for_play(
-                        game_id=queued_play.game_id,
-                        play_id=queued_play.mlb_play_data.get('atBatIndex', 0),
-                        game_date=queued_play.game_date,
-                        mlb_play_data=queued_play.mlb_play_data
-                    )
-                    
-                    if gif_path and os.path.exists(gif_path):
-                        successful_gifs += 1
-                        queued_play.gif_created = True
-                        queued_play.gif_path = gif_path
-                        
-                        logger.info(f"   ✅ GIF created: {gif_path}")
-                        
-                        # Try to post if Twitter is available
-                        if self.tracker.twitter_api:
-                            logger.info(f"   🐦 Attempting to post to Twitter...")
-                            
-                            if self.tracker.post_complete_tweet_with_gif(queued_play):
-                                successful_posts += 1
-                                logger.info(f"   ✅ Tweet posted successfully!")
-                            else:
-                                logger.error(f"   ❌ Tweet posting failed")
-                        else:
-                            logger.info(f"   ⏭️  Skipping Twitter post (API not connected)")
-                    else:
-                        logger.warning(f"   ⏳ GIF not available yet")
+                    logger.info("   ✅ Play queued successfully")
+                    queued_plays.append(self.tracker.play_queue[-1])  # Get the just-added play
                 else:
-                    logger.error(f"   ❌ Failed to queue play")
-                
-                # Small delay between plays to avoid overwhelming APIs
-                if i < len(self.found_plays):
-                    time.sleep(2)
+                    logger.error("   ❌ Failed to queue play")
                     
             except Exception as e:
-                logger.error(f"   ❌ Error processing play: {e}")
+                logger.error("   ❌ Error queueing play: %s", e)
+        
+        # GIFs render side by side; tweets go out one at a time as each finishes
+        logger.info("🎬 Creating %d GIFs (%d at a time)...", len(queued_plays), _GIF_WORKERS)
+        with ThreadPoolExecutor(max_workers=_GIF_WORKERS) as pool:
+            futures = {pool.submit(self._create_gif, queued_play): queued_play for queued_play in queued_plays}
+            
+            for future in as_completed(futures):
+                queued_play = futures[future]
+                try:
+                    gif_path = future.result()
+                except Exception as e:
+                    logger.error("   ❌ Error creating GIF for %s: %s", queued_play.event, e)
+                    continue
+                
+                if not gif_path:
+                    logger.warning("   ⏳ GIF not available yet for %s", queued_play.event)
+                    continue
+                
+                successful_gifs += 1
+                queued_play.gif_created = True
+                queued_play.gif_path = gif_path
+                logger.info("   ✅ GIF created for %s: %s", queued_play.event, gif_path)
+                
+                # Try to post if Twitter is available
+                if not self.tracker.twitter_api:
+                    logger.info("   ⏭️  Skipping Twitter post (API not connected)")
+                    continue
+                
+                logger.info("   🐦 Attempting to post to Twitter...")
+                try:
+                    if self.tracker.post_complete_tweet_with_gif(queued_play):
+                        successful_posts += 1
+                        logger.info("   ✅ Tweet posted successfully!")
+                    else:
+                        logger.error("   ❌ Tweet posting failed")
+                except Exception as e:
+                    logger.error("   ❌ Error posting play: %s", e)
         
         # Final summary
-        logger.info(f"\n🎉 END-TO-END TEST COMPLETE!")
-        logger.info(f"   Plays found: {len(self.found_plays)}")
-        logger.info(f"   GIFs created: {successful_gifs}")
-        logger.info(f"   Tweets posted: {successful_posts}")
-        logger.info(f"   Success rate: {(successful_gifs/len(self.found_plays)*100):.1f}% GIFs, {(successful_posts/len(self.found_plays)*100):.1f}% tweets")
+        logger.info("\n🎉 END-TO-END TEST COMPLETE!")
+        logger.info("   Plays found: %d", len(self.found_plays))
+        logger.info("   GIFs created: %d", successful_gifs)
+        logger.info("   Tweets posted: %d", successful_posts)
+        logger.info("   Success rate: %.1f%% GIFs, %.1f%% tweets",
+                    successful_gifs / len(self.found_plays) * 100, successful_posts / len(self.found_plays) * 100)
         
         # Save results for review
         results = {
@@ -231,20 +365,20 @@ class LastNightPlayTester:
             'successful_posts': successful_posts,
             'plays': [
                 {
-                    'game': f"{p['game_info']['away_team']} @ {p['game_info']['home_team']}",
-                    'event': p['event'],
-                    'impact': f"{p['impact_score']:.1%}",
-                    'inning': f"{p['half_inning']} {p['inning']}",
-                    'description': p['description']
+                    'game': f"{game_info['away_team']} @ {game_info['home_team']}",
+                    'event': play.get('event', ''),
+                    'impact': f"{impact_score:.1%}",
+                    'inning': f"{play.get('half_inning', '')} {play.get('inning', 0)}",
+                    'description': play.get('description', '')
                 }
-                for p in self.found_plays
+                for game_info, play, impact_score in self.found_plays
             ]
         }
         
-        with open(f'test_results_{self.test_date}.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(f'test_results_{self.test_date}.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
-        logger.info(f"   Results saved to: test_results_{self.test_date}.json")
+        logger.info("   Results saved to: test_results_%s.json", self.test_date)
 
 def main():
     """Run the test"""
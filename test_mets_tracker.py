@@ -8,8 +8,11 @@ import os
 import sys
 import time
 import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from mets_homerun_tracker import MetsHomeRunTracker
+from mets_homerun_tracker import MetsHomeRunTracker, MetsHomeRun
 
 # Configure logging
 logging.basicConfig(
@@ -18,13 +21,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_tracker_init_lock = threading.Lock()
+
+def _new_tracker():
+    """Build a tracker; construction loads (and may migrate) the on-disk queue, so one at a time"""
+    with _tracker_init_lock:
+        return MetsHomeRunTracker()
+
 def test_basic_functionality():
     """Test basic tracker functionality"""
     logger.info("🧪 Testing basic Mets HR Tracker functionality...")
     
     try:
         # Initialize tracker
-        tracker = MetsHomeRunTracker()
+        tracker = _new_tracker()
         logger.info("✅ Tracker initialized successfully")
         
         # Test getting Mets games
@@ -35,7 +45,7 @@ def test_basic_functionality():
             # Test getting plays from first game
             game_id = games[0]['gamePk']
             plays = tracker.get_game_plays(game_id)
-            logger.info(f"✅ Found {len(plays)} plays in game {game_id}")
+            logger.info(f"✅ Found {len(plays)} home run plays in game {game_id}")
             
             # Test home run detection
             mets_hrs = 0
@@ -94,7 +104,7 @@ def test_monitoring_cycle():
     logger.info("🔄 Testing monitoring cycle...")
     
     try:
-        tracker = MetsHomeRunTracker()
+        tracker = _new_tracker()
         
         # Simulate one monitoring cycle
         games = tracker.get_live_mets_games()
@@ -120,11 +130,63 @@ def test_monitoring_cycle():
         logger.error(f"❌ Monitoring cycle test failed: {e}")
         return False
 
+def test_queue_journal_compaction():
+    """Test that HRs cleaned up mid-pass stay gone when compaction fires during cleanup"""
+    logger.info("💾 Testing queue journal compaction...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Trackers load and save their queue relative to the cwd, so build them
+            # in a scratch directory rather than against the real queue
+            original_cwd = os.getcwd()
+            os.chdir(tmp_dir)
+            try:
+                tracker = MetsHomeRunTracker()
+                tracker.journal_compact_every = 2  # Compact partway through the removals
+                
+                for i in range(3):
+                    tracker.homerun_queue.append(MetsHomeRun(
+                        play_id=f"1_{i}", game_id=1, game_date="2025-06-17",
+                        description="Test HR", batter=f"Batter {i}", pitcher="Pitcher",
+                        inning=1, half_inning="top", home_team="NYM", away_team="ATL",
+                        home_score=1, away_score=0,
+                        gif_attempts=5  # Exhausted, so the pass cleans each one up
+                    ))
+                tracker.save_queue()
+                
+                tracker.process_gif_queue()
+                
+                # Simulate a crash: reload from disk without a final snapshot
+                reloaded = MetsHomeRunTracker()
+            finally:
+                os.chdir(original_cwd)
+            
+            if reloaded.homerun_queue:
+                logger.error(f"❌ {len(reloaded.homerun_queue)} cleaned-up HRs came back after reload")
+                return False
+        
+        logger.info("✅ Cleaned-up HRs stay removed across compaction and reload")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Queue journal compaction test failed: {e}")
+        return False
+
+def _timed(test_func):
+    """Run a test, returning its result and wall time"""
+    start_time = time.time()
+    success = test_func()
+    return success, time.time() - start_time
+
 def run_all_tests():
     """Run all tests"""
     logger.info("🚀 Starting Mets Home Run Tracker Tests")
     logger.info("=" * 50)
     
+    # Changes the working directory, so it runs on its own before the others start
+    serial_tests = [
+        ("Queue Journal Compaction", test_queue_journal_compaction)
+    ]
     tests = [
         ("Basic Functionality", test_basic_functionality),
         ("GIF Integration", test_gif_integration),
@@ -132,15 +194,10 @@ def run_all_tests():
         ("Monitoring Cycle", test_monitoring_cycle)
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
-        logger.info(f"\n📝 Running {test_name} test...")
-        start_time = time.time()
-        success = test_func()
-        duration = time.time() - start_time
-        
-        results.append({
+    serial_results = []
+    for test_name, test_func in serial_tests:
+        success, duration = _timed(test_func)
+        serial_results.append({
             'name': test_name,
             'success': success,
             'duration': duration
@@ -149,6 +206,29 @@ def run_all_tests():
         status = "✅ PASSED" if success else "❌ FAILED"
         logger.info(f"{status} - {test_name} ({duration:.2f}s)")
     
+    # The rest are independent and mostly network-bound, so run them side by side
+    logger.info(f"\n📝 Running {len(tests)} tests in parallel...")
+    results = [None] * len(tests)
+    
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = {pool.submit(_timed, test_func): index for index, (_, test_func) in enumerate(tests)}
+        
+        for future in as_completed(futures):
+            index = futures[future]
+            test_name = tests[index][0]
+            success, duration = future.result()
+            
+            results[index] = {
+                'name': test_name,
+                'success': success,
+                'duration': duration
+            }
+            
+            status = "✅ PASSED" if success else "❌ FAILED"
+            logger.info(f"{status} - {test_name} ({duration:.2f}s)")
+    
+    results = serial_results + results
+    
     # Summary
     logger.info("\n" + "=" * 50)
     logger.info("📊 TEST SUMMARY")